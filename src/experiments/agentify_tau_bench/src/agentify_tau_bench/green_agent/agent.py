@@ -1,25 +1,32 @@
 """Green agent implementation - manages assessment and evaluation."""
 
 import asyncio
+import functools
 import json
 import os
+import re
 import time
 import tomllib
+import uuid
+from concurrent.futures import Executor, ThreadPoolExecutor
 from typing import Optional
 
 import dotenv
 import gymnasium as gym
+import httpx
+import msgspec
+import orjson
 import uvicorn
 from a2a.server.agent_execution import AgentExecutor, RequestContext
 from a2a.server.apps import A2AStarletteApplication
 from a2a.server.events import EventQueue
 from a2a.server.request_handlers import DefaultRequestHandler
 from a2a.server.tasks import InMemoryTaskStore
-from a2a.types import AgentCard, Message, SendMessageSuccessResponse
+from a2a.types import AgentCard
 from a2a.utils import get_text_parts, new_agent_text_message
-from agentify_tau_bench.utils import a2a_send_message, parse_tags
+from agentify_tau_bench.utils import a2a_send_message, parse_tag
 from loguru import logger
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from tau2.data_model.simulation import RewardInfo, SimulationRun
 from tau2.environment.tool import Tool
@@ -30,18 +37,101 @@ dotenv.load_dotenv()
 
 RESPOND_ACTION_NAME = "respond"
 
+CONCURRENCY_LIMIT = 2  # Reduced from 10 to avoid overwhelming the white agent
+PROGRESS_REPORT_INTERVAL = 0.5  # Seconds to coalesce task progress into one status update
+WHITE_AGENT_MAX_CONNECTIONS = 64  # Shared client pool size for white agent calls
+WHITE_AGENT_MAX_KEEPALIVE_CONNECTIONS = 32
+WHITE_AGENT_TIMEOUT = 120.0  # Seconds, matches the default in a2a_send_message
+
+# Only the <json> block of the white agent reply is needed on each step
+_JSON_TAG_RE = re.compile(r"<json>(.*?)</json>", re.DOTALL)
+
 # Register the environments (only needed once)
 register_gym_agent()
 
 
+@functools.lru_cache(maxsize=8)
 def load_agent_card_toml(agent_name):
     current_dir = __file__.rsplit("/", 1)[0]
     with open(f"{current_dir}/{agent_name}.toml", "rb") as f:
         return tomllib.load(f)
 
 
-def tools_to_str(tools: list[Tool]) -> str:
-    return json.dumps([tool.openai_schema for tool in tools], indent=2)
+# Tool schemas are fixed per domain, so the serialized list is cached per
+# (domain, tool names); the oldest entry is evicted once the cache is full
+_TOOLS_STR_CACHE: dict[tuple, str] = {}
+_TOOLS_STR_CACHE_SIZE = 16
+
+
+def tools_to_str(tools: list[Tool], domain: Optional[str] = None) -> str:
+    """
+    Serialize the tool schemas for the white agent.
+    Only calls that name a domain are cached; without one the schemas are
+    always dumped fresh.
+    """
+    if domain is None:
+        return orjson.dumps([tool.openai_schema for tool in tools]).decode()
+    key = (domain, tuple(tool.name for tool in tools))
+    tools_str = _TOOLS_STR_CACHE.get(key)
+    if tools_str is None:
+        tools_str = orjson.dumps([tool.openai_schema for tool in tools]).decode()
+        if len(_TOOLS_STR_CACHE) >= _TOOLS_STR_CACHE_SIZE:
+            del _TOOLS_STR_CACHE[next(iter(_TOOLS_STR_CACHE))]
+        _TOOLS_STR_CACHE[key] = tools_str
+    return tools_str
+
+
+TOOL_CALL_EXAMPLE = json.dumps(
+    {
+        "name": "find_user_id_by_name_zip",
+        "arguments": {
+            "first_name": "Yusuf",
+            "last_name": "Rossi",
+            "zip_code": "19122",
+        },
+    },
+    indent=2,
+)
+
+RESPOND_EXAMPLE = json.dumps(
+    {
+        "name": RESPOND_ACTION_NAME,
+        "arguments": {"content": "Hello, how can I help you today?"},
+    },
+    indent=2,
+)
+
+
+@functools.lru_cache(maxsize=16)
+def build_task_prefix(policy: str, tools_str: str) -> str:
+    """
+    Build the constant part of the task description sent to the white agent.
+    Everything except the first observation depends only on the domain, so the
+    prefix is built once per (policy, tools) pair and ends right before the
+    user message.
+    """
+    return f"""
+{policy}
+Here's a list of tools you can use (you can use at most one tool at a time):
+{tools_str}
+Please response in the JSON format. Please wrap the JSON part with <json>...</json> tags.
+The JSON should contain:
+- "name": the tool call function name, or "{RESPOND_ACTION_NAME}" if you want to respond directly.
+- "arguments": the arguments for the tool call, or {{"content": "your message here"}} if you want to respond directly.
+You should only use one tool at a time!!
+You cannot respond to user and use a tool at the same time!!
+
+Examples of responses:
+<json>
+{TOOL_CALL_EXAMPLE}
+</json>
+
+<json>
+{RESPOND_EXAMPLE}
+</json>
+
+Next, I'll provide you with the user message and tool call results.
+User message: """
 
 
 def get_task_ids(domain: str, task_ids: Optional[list[str]]) -> list[str]:
@@ -50,6 +140,16 @@ def get_task_ids(domain: str, task_ids: Optional[list[str]]) -> list[str]:
     If task_ids are not specified, it will get all tasks for the domain.
     Else, it will validate the task IDs against the domain
     """
+    # Lists are unhashable, so convert at the cache boundary
+    key = tuple(task_ids) if task_ids is not None else None
+    return list(_get_task_ids_cached(domain, key))
+
+
+@functools.lru_cache(maxsize=None)
+def _get_task_ids_cached(
+    domain: str, task_ids: Optional[tuple[str, ...]]
+) -> tuple[str, ...]:
+    # Task sets are immutable within a process, so the dataset is loaded once per key
     task_set_name = domain
     task_split_name = "base"
     if task_ids is None:
@@ -58,13 +158,17 @@ def get_task_ids(domain: str, task_ids: Optional[list[str]]) -> list[str]:
         tasks = get_tasks(
             task_set_name=task_set_name,
             task_split_name=task_split_name,
-            task_ids=task_ids,
+            task_ids=list(task_ids),
         )
 
-    return [task.id for task in tasks]
+    return tuple(task.id for task in tasks)
 
 
 class EnvConfig(BaseModel):
+    # Built once per evaluation request: defer schema construction to first use,
+    # and keep assignment unvalidated since task_ids is rewritten after parsing
+    model_config = ConfigDict(extra="ignore", validate_assignment=False, defer_build=True)
+
     domain: str = Field(description="The domain to run the simulation on")
     task_ids: Optional[list[str]] = Field(
         description="The task IDs to run the simulation. If None, will run all tasks for the domain.",
@@ -82,14 +186,22 @@ class EnvConfig(BaseModel):
         description="The arguments to pass to the user simulator LLM. If None, will use the default arguments for the domain.",
         default=None,
     )
+    max_concurrent_tasks: int = Field(
+        description="The maximum number of tasks to run concurrently against the white agent.",
+        default=CONCURRENCY_LIMIT,
+        ge=1,
+    )
 
 
-class EvalRequest(BaseModel):
+class EvalRequest(msgspec.Struct, frozen=True):
     """AgentBeats evaluation request format."""
     participants: dict[str, str]  # {"agent": "http://..."}
     config: dict  # {"domain": "hospitality", "max_steps": 100, ...}
 
 
+_EVAL_REQUEST_DECODER = msgspec.json.Decoder(EvalRequest)
+
+
 def get_green_agent_config(user_input: str) -> tuple[str, str, EnvConfig]:
     """
     Get the green agent configuration from the user input.
@@ -106,7 +218,7 @@ def get_green_agent_config(user_input: str) -> tuple[str, str, EnvConfig]:
     
     try:
         # Parse AgentBeats JSON format
-        request = EvalRequest.model_validate_json(user_input)
+        request = _EVAL_REQUEST_DECODER.decode(user_input)
         
         # Get white agent URL and name from participants
         # AgentBeats uses participant name as the role name
@@ -122,28 +234,32 @@ def get_green_agent_config(user_input: str) -> tuple[str, str, EnvConfig]:
         # Get num_tasks limit
         num_tasks = request.config.get("num_tasks")
         
-        # Build EnvConfig from config dict
-        env_config = EnvConfig(
-            domain=request.config.get("domain", "hospitality"),
-            task_ids=request.config.get("task_ids"),
-            max_steps=request.config.get("max_steps", 100),
-            user_llm=request.config.get("user_llm"),
-            user_llm_args=request.config.get("user_llm_args"),
+        # Build EnvConfig from config dict. msgspec leaves the config values
+        # untyped, so they are validated here
+        env_config = EnvConfig.model_validate(
+            {
+                "domain": request.config.get("domain", "hospitality"),
+                "task_ids": request.config.get("task_ids"),
+                "max_steps": request.config.get("max_steps", 100),
+                "user_llm": request.config.get("user_llm"),
+                "user_llm_args": request.config.get("user_llm_args"),
+                "max_concurrent_tasks": request.config.get(
+                    "max_concurrent_tasks", CONCURRENCY_LIMIT
+                ),
+            }
         )
         
     except Exception as e:
         # Fallback to legacy tag-based format for backward compatibility
         logger.warning(f"Failed to parse AgentBeats format, trying legacy format: {e}")
-        tags = parse_tags(user_input)
-        try:
-            white_agent_url = tags["white_agent_url"]
-        except Exception as e:
-            raise ValueError(f"Error parsing white agent URL: {e}")
-
-        try:
-            env_config_json = tags["env_config"]
-        except Exception as e:
-            raise ValueError(f"Error parsing env config: {e}")
+        # Only two tags are needed, so look them up directly
+        white_agent_url = parse_tag(user_input, "white_agent_url")
+        if white_agent_url is None:
+            raise ValueError("Error parsing white agent URL: missing <white_agent_url>")
+
+        env_config_json = parse_tag(user_input, "env_config")
+        if env_config_json is None:
+            raise ValueError("Error parsing env config: missing <env_config>")
         try:
             env_config = EnvConfig.model_validate_json(env_config_json)
         except Exception as e:
@@ -164,68 +280,55 @@ def get_green_agent_config(user_input: str) -> tuple[str, str, EnvConfig]:
     return white_agent_url, agent_name, env_config
 
 
+async def run_env_call(executor: Optional[Executor], func, *args, **kwargs):
+    """
+    Run a synchronous gym call in a worker thread.
+    If executor is None, the loop's default thread pool is used.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, functools.partial(func, *args, **kwargs))
+
+
 async def ask_agent_to_solve(
     white_agent_url: str,
     env: gym.Env,
     max_retries: int = 3,
+    http_client: Optional[httpx.AsyncClient] = None,
+    task_id: Optional[str] = None,
+    env_executor: Optional[Executor] = None,
+    domain: Optional[str] = None,
 ) -> Optional[SimulationRun]:
     terminated = False
     context_id = None
-    observation, info = env.reset()
+    # reset/step are synchronous and may call the user simulator LLM, so run them
+    # in a worker thread to keep the event loop free for the other tasks.
+    # A task_id switches a reused env to that task.
+    if task_id is None:
+        observation, info = await run_env_call(env_executor, env.reset)
+    else:
+        observation, info = await run_env_call(
+            env_executor, env.reset, options={"task_id": task_id}
+        )
     # Access available tools and policy from info
 
     # Here, instead of calling white agent like calling an LLM, we need to present
     #   the assessment scenario to the white agent as if it is a independent task
     # Specifically, here we provide the tool information for the agent to reply with
-    task_description = f"""
-{info["policy"]}
-Here's a list of tools you can use (you can use at most one tool at a time):
-{tools_to_str(info["tools"])}
-Please response in the JSON format. Please wrap the JSON part with <json>...</json> tags.
-The JSON should contain:
-- "name": the tool call function name, or "{
-        RESPOND_ACTION_NAME
-    }" if you want to respond directly.
-- "arguments": the arguments for the tool call, or {{"content": "your message here"}} if you want to respond directly.
-You should only use one tool at a time!!
-You cannot respond to user and use a tool at the same time!!
-
-Examples of responses:
-<json>
-{
-        json.dumps(
-            {
-                "name": "find_user_id_by_name_zip",
-                "arguments": {
-                    "first_name": "Yusuf",
-                    "last_name": "Rossi",
-                    "zip_code": "19122",
-                },
-            },
-            indent=2,
-        )
-    }
-</json>
-
-<json>
-{
-        json.dumps(
-            {
-                "name": "{RESPOND_ACTION_NAME}",
-                "arguments": {"content": "Hello, how can I help you today?"},
-            },
-            indent=2,
-        )
-    }
-</json>
-
-Next, I'll provide you with the user message and tool call results.
-User message: {json.dumps(observation, indent=2)}
-    """
+    task_description = build_task_prefix(
+        info["policy"], tools_to_str(info["tools"], domain=domain)
+    ) + orjson.dumps(observation).decode()
     next_green_message = task_description
     while not terminated:
+        # Per-step payloads can be several KB: log sizes at INFO and defer
+        # formatting the full bodies to DEBUG so dropped records cost nothing
         logger.info(
-            f"@@@ Green agent: Sending message to white agent{'ctx_id=' + str(context_id) if context_id else ''}... -->\n{next_green_message}"
+            "@@@ Green agent: Sending message to white agent{}... ({} chars)",
+            " ctx_id=" + str(context_id) if context_id else "",
+            len(next_green_message),
+        )
+        logger.opt(lazy=True).debug(
+            "@@@ Green agent: Message to white agent -->\n{}",
+            lambda: next_green_message,
         )
 
         # Retry logic for white agent communication
@@ -233,7 +336,10 @@ User message: {json.dumps(observation, indent=2)}
         for attempt in range(max_retries):
             try:
                 white_agent_response = await a2a_send_message(
-                    white_agent_url, next_green_message, context_id=context_id
+                    white_agent_url,
+                    next_green_message,
+                    context_id=context_id,
+                    httpx_client=http_client,
                 )
                 break  # Success, exit retry loop
             except Exception as e:
@@ -250,41 +356,41 @@ User message: {json.dumps(observation, indent=2)}
             logger.error("Failed to get response from white agent after retries")
             return None
 
-        res_root = white_agent_response.root
-        assert isinstance(res_root, SendMessageSuccessResponse), (
-            f"Expected SendMessageSuccessResponse, got {type(res_root)}"
-        )
-        res_result = res_root.result
-        assert isinstance(res_result, Message), (
-            f"Expected Message, got {type(res_result)}"
-        )
+        # Expected shape: a SendMessageSuccessResponse wrapping a Message with exactly
+        # one text part. Error responses and Task results lack these attributes, so
+        # one structural access replaces per-step isinstance checks. The white agent
+        # echoes our context_id, so it is fixed after the first reply.
+        try:
+            res_result = white_agent_response.root.result
+            (white_text,) = get_text_parts(res_result.parts)
+        except (AttributeError, ValueError) as e:
+            raise ValueError(
+                "Expected a single-text-part Message from the white agent, "
+                f"got {white_agent_response.root!r}"
+            ) from e
         if context_id is None:
             context_id = res_result.context_id
-        else:
-            assert context_id == res_result.context_id, (
-                "Context ID should remain the same in a conversation"
-            )
 
-        text_parts = get_text_parts(res_result.parts)
-        assert len(text_parts) == 1, (
-            "Expecting exactly one text part from the white agent"
-        )
-        white_text = text_parts[0]
-        logger.info(f"@@@ White agent response:\n{white_text}")
+        logger.info("@@@ White agent response ({} chars)", len(white_text))
+        logger.opt(lazy=True).debug("@@@ White agent response:\n{}", lambda: white_text)
         # parse the action out
-        white_tags = parse_tags(white_text)
-        logger.info(f"@@@ White agent tags: {white_tags}")
-        action_json = white_tags["json"]
-        action_dict = json.loads(action_json)
+        json_match = _JSON_TAG_RE.search(white_text)
+        if json_match is None:
+            raise ValueError("White agent response has no <json> block")
+        action_dict = orjson.loads(json_match.group(1))
         is_tool_call = action_dict["name"] != RESPOND_ACTION_NAME
         if not is_tool_call:
             action = action_dict["arguments"]["content"]
         else:
-            action = json.dumps(action_dict)
+            action = orjson.dumps(action_dict).decode()
 
-        observation, reward, terminated, truncated, info = env.step(action)
-        logger.info(f"@@@ Green agent: Observation: {observation}")
-        logger.info(f"@@@ Green agent: Reward: {reward}")
+        observation, reward, terminated, truncated, info = await run_env_call(
+            env_executor, env.step, action
+        )
+        logger.opt(lazy=True).debug(
+            "@@@ Green agent: Observation: {}", lambda: observation
+        )
+        logger.info("@@@ Green agent: Reward: {}", reward)
         next_green_message = observation
 
         # instead of maintain history, just prepare the next message with the latest observation
@@ -292,22 +398,19 @@ User message: {json.dumps(observation, indent=2)}
             break
         # TODO: We need to reset the green agent!!!
 
+    # Validate straight from the JSON strings so a malformed payload fails here
+    # instead of surfacing later as a missing attribute
     if info["simulation_run"] is not None:
         simulation_run = SimulationRun.model_validate_json(info["simulation_run"])
     else:
         simulation_run = None
-    if info["reward_info"] is not None:
+    if simulation_run is not None and info["reward_info"] is not None:
         reward_info = RewardInfo.model_validate_json(info["reward_info"])
         simulation_run.reward_info = reward_info
     return simulation_run
 
 
-CONCURRENCY_LIMIT = 2  # Reduced from 10 to avoid overwhelming the white agent
-
-
 class TauGreenAgentExecutor(AgentExecutor):
-    def __init__(self):
-        self.semaphore = asyncio.Semaphore(CONCURRENCY_LIMIT)
 
     async def execute(self, context: RequestContext, event_queue: EventQueue) -> None:
         from a2a.server.tasks import TaskUpdater
@@ -346,30 +449,79 @@ class TauGreenAgentExecutor(AgentExecutor):
         metrics = {"info": {}, "tasks": {}}
         timestamp_started = time.time()
         completed_count = 0
-
-        async def run_one_task(task_id: str) -> None:
-            nonlocal completed_count
-            async with self.semaphore:
+        semaphore = asyncio.Semaphore(env_config.max_concurrent_tasks)
+        # Envs are reset per task, so idle ones are handed to the next task instead
+        # of building a new one. The semaphore caps the pool at max_concurrent_tasks.
+        env_pool: list[gym.Env] = []
+        in_flight: set[str] = set()
+        progress_changed = asyncio.Event()
+        all_done = False
+        # Per-task rewards are streamed as chunks of one artifact so clients can
+        # render results as they arrive instead of waiting for the final summary
+        task_results_artifact_id = str(uuid.uuid4())
+        task_results_started = False
+
+        async def report_progress() -> None:
+            # A single reporter batches per-task progress into at most one status
+            # update per interval instead of two event-queue messages per task
+            while True:
+                await progress_changed.wait()
+                if not all_done:
+                    await asyncio.sleep(PROGRESS_REPORT_INTERVAL)
+                progress_changed.clear()
+                # Progress is best-effort: a failed update must not stop the
+                # reporter or the final results
                 try:
-                    logger.info(f"Green agent: Running task {task_id}...")
                     await updater.update_status(
                         TaskState.working,
-                        new_agent_text_message(f"Running task {task_id}...")
+                        new_agent_text_message(
+                            f"Completed {completed_count}/{len(env_config.task_ids)} tasks, "
+                            f"in flight: {sorted(in_flight)}"
+                        ),
                     )
-                    
-                    task_env_config = {
-                        "domain": env_config.domain,
-                        "task_id": task_id,
-                        "max_steps": env_config.max_steps,
-                        "user_llm": env_config.user_llm,
-                        "user_llm_args": env_config.user_llm_args,
-                        "all_messages_as_observation": False,
-                    }
-                    env = gym.make(TAU_BENCH_ENV_ID, **task_env_config)
+                except Exception as e:
+                    logger.warning(f"Green agent: Failed to report progress: {e}")
+                if all_done:
+                    return
+
+        async def run_one_task(task_id: str) -> None:
+            nonlocal completed_count, task_results_started
+            async with semaphore:
+                in_flight.add(task_id)
+                progress_changed.set()
+                env: Optional[gym.Env] = None
+                try:
+                    logger.info(f"Green agent: Running task {task_id}...")
+                    if env_pool:
+                        env = env_pool.pop()
+                    else:
+                        task_env_config = {
+                            "domain": env_config.domain,
+                            "task_id": task_id,
+                            "max_steps": env_config.max_steps,
+                            "user_llm": env_config.user_llm,
+                            "user_llm_args": env_config.user_llm_args,
+                            "all_messages_as_observation": False,
+                        }
+                        # Build the env in a worker thread so construction overlaps with
+                        # other tasks' white agent I/O instead of blocking the loop
+                        env = await run_env_call(
+                            env_threads, gym.make, TAU_BENCH_ENV_ID, **task_env_config
+                        )
                     res = await ask_agent_to_solve(
                         white_agent_url,
                         env,
+                        http_client=http_client,
+                        task_id=task_id,
+                        env_executor=env_threads,
+                        domain=env_config.domain,
                     )
+                    # Only envs that finished cleanly go back. A result is only
+                    # returned once the episode terminated; otherwise the env may
+                    # still have a live orchestrator thread
+                    if res is not None:
+                        env_pool.append(env)
+                        env = None
                     if res is not None and res.reward_info is not None:
                         metrics["tasks"][task_id] = res.reward_info.reward
                     else:
@@ -377,24 +529,97 @@ class TauGreenAgentExecutor(AgentExecutor):
                             f"Green agent: Task {task_id} returned None or missing reward_info"
                         )
                         metrics["tasks"][task_id] = 0
-                    
-                    completed_count += 1
-                    await updater.update_status(
-                        TaskState.working,
-                        new_agent_text_message(f"Completed task {task_id} ({completed_count}/{len(env_config.task_ids)})")
-                    )
                 except Exception as e:
                     logger.error(f"Green agent: Error running task {task_id}: {e}")
                     metrics["tasks"][task_id] = 0
+                finally:
+                    if env is not None:
+                        # Drop unfinished envs rather than handing them to the next task
+                        try:
+                            env.close()
+                        except Exception as e:
+                            logger.warning(
+                                f"Green agent: Failed to close env for task {task_id}: {e}"
+                            )
                     completed_count += 1
+                    in_flight.discard(task_id)
+                    progress_changed.set()
+                    # Streaming is best-effort like progress: the final summary
+                    # still carries every reward if a chunk fails to send
+                    try:
+                        await updater.add_artifact(
+                            parts=[
+                                Part(
+                                    root=DataPart(
+                                        data={
+                                            "task_id": task_id,
+                                            "reward": metrics["tasks"].get(task_id, 0),
+                                        }
+                                    )
+                                )
+                            ],
+                            artifact_id=task_results_artifact_id,
+                            name="Task Results",
+                            append=task_results_started,
+                            last_chunk=completed_count == len(env_config.task_ids),
+                        )
+                        task_results_started = True
+                    except Exception as e:
+                        logger.warning(
+                            f"Green agent: Failed to stream result for task {task_id}: {e}"
+                        )
 
-        # Run tasks sequentially to avoid overwhelming the system
-        for task_id in env_config.task_ids:
-            await run_one_task(task_id)
+        # Run tasks concurrently, capped by the semaphore to avoid overwhelming the white agent
+        # All tasks share one pooled client so white agent calls reuse keep-alive connections.
+        # Gym calls get their own thread pool sized to the task concurrency, so they
+        # don't compete with other users of the process-wide default executor.
+        # The pool is shut down without waiting: a `with` block would block the
+        # event loop on any env.step still stuck on the user LLM after a failure
+        # or cancellation.
+        env_threads = ThreadPoolExecutor(
+            max_workers=env_config.max_concurrent_tasks, thread_name_prefix="tau-env"
+        )
+        try:
+            async with httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=WHITE_AGENT_MAX_CONNECTIONS,
+                    max_keepalive_connections=WHITE_AGENT_MAX_KEEPALIVE_CONNECTIONS,
+                ),
+                timeout=WHITE_AGENT_TIMEOUT,
+            ) as http_client:
+                reporter = asyncio.create_task(report_progress())
+                try:
+                    await asyncio.gather(
+                        *[run_one_task(task_id) for task_id in env_config.task_ids],
+                        return_exceptions=True,
+                    )
+                    # Flush the final progress update
+                    all_done = True
+                    progress_changed.set()
+                    try:
+                        await reporter
+                    except Exception as e:
+                        logger.warning(f"Green agent: Progress reporter failed: {e}")
+                finally:
+                    reporter.cancel()
+        finally:
+            # Pooled envs are idle once every task is done, so close them here
+            while env_pool:
+                try:
+                    env_pool.pop().close()
+                except Exception as e:
+                    logger.warning(f"Green agent: Failed to close pooled env: {e}")
+            env_threads.shutdown(wait=False, cancel_futures=True)
 
         time_used = time.time() - timestamp_started
-        total_reward = sum(metrics["tasks"].values())
-        num_completed = len(metrics["tasks"])
+        # Tasks finish in any order, so report them in the requested order
+        task_rewards = {
+            tid: metrics["tasks"][tid]
+            for tid in env_config.task_ids
+            if tid in metrics["tasks"]
+        }
+        total_reward = sum(task_rewards.values())
+        num_completed = len(task_rewards)
         pass_rate = (total_reward / num_completed * 100) if num_completed > 0 else 0
 
         # Build result data in AgentBeats format
@@ -405,14 +630,16 @@ class TauGreenAgentExecutor(AgentExecutor):
             "score": total_reward,
             "max_score": num_completed,
             "pass_rate": pass_rate,
-            "task_rewards": metrics["tasks"],
+            "task_rewards": task_rewards,
             "time_used": time_used,
         }
 
-        task_results_str = "\n".join(
-            f"  {tid}: {'✓' if reward == 1.0 else '✗'} ({reward})"
-            for tid, reward in metrics["tasks"].items()
-        )
+        # Build the list up front so join can size the result in one pass
+        task_result_lines = []
+        for tid, reward in task_rewards.items():
+            mark = "✓" if reward == 1.0 else "✗"
+            task_result_lines.append(f"  {tid}: {mark} ({reward})")
+        task_results_str = "\n".join(task_result_lines)
         summary = f"""Tau2 Benchmark Results
 Domain: {env_config.domain}
 Tasks: {num_completed}
@@ -424,7 +651,8 @@ Task Results:
 
         logger.info("Green agent: Evaluation complete.")
         
-        # Add artifact with results
+        # Add the final artifact with the summary; result_data still carries all
+        # task rewards because leaderboard queries read them from here
         await updater.add_artifact(
             parts=[
                 Part(root=TextPart(text=summary)),
@@ -449,7 +677,8 @@ def start_green_agent(agent_name="tau2_green_agent", host="0.0.0.0", port=9001):
         port: The port to run the green agent on.
     """
     logger.info("Starting green agent...")
-    agent_card_dict = load_agent_card_toml(agent_name)
+    # Copy the cached card so the url override below does not leak into the cache
+    agent_card_dict = dict(load_agent_card_toml(agent_name))
 
     # url = f"http://{host}:{port}"
     # agent_card_dict["url"] = url  # complete all required card fields
@@ -8,6 +8,11 @@ from agentify_tau_bench.launcher import launch_evaluation
 from agentify_tau_bench.white_agent import start_white_agent
 from pydantic_settings import BaseSettings
 
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None
+
 
 class TaubenchSettings(BaseSettings):
     role: str = "unspecified"
@@ -47,7 +52,10 @@ def white(
 @app.command()
 def launch():
     """Launch the complete evaluation workflow."""
-    asyncio.run(launch_evaluation())
+    if uvloop is not None:
+        uvloop.run(launch_evaluation())
+    else:
+        asyncio.run(launch_evaluation())
 
 
 @app.command()
@@ -3,6 +3,12 @@ from agentify_tau_bench.utils.a2a_utils import (
     get_agent_card,
     wait_agent_ready,
 )
-from agentify_tau_bench.utils.utils import parse_tags
+from agentify_tau_bench.utils.utils import parse_tag, parse_tags
 
-__all__ = ["get_agent_card", "a2a_send_message", "wait_agent_ready", "parse_tags"]
+__all__ = [
+    "get_agent_card",
+    "a2a_send_message",
+    "wait_agent_ready",
+    "parse_tag",
+    "parse_tags",
+]
@@ -17,17 +17,21 @@ from a2a.types import (
 from loguru import logger
 
 
-async def get_agent_card(url: str) -> AgentCard | None:
+async def get_agent_card(
+    url: str, httpx_client: Optional[httpx.AsyncClient] = None
+) -> AgentCard | None:
     """
     Get the agent card from the A2A server.
 
     Args:
         url: The URL of the A2A server.
+        httpx_client: Optional shared HTTP client. A new one is created if None.
 
     Returns:
         The agent card if found, None otherwise.
     """
-    httpx_client = httpx.AsyncClient()
+    if httpx_client is None:
+        httpx_client = httpx.AsyncClient()
     resolver = A2ACardResolver(httpx_client=httpx_client, base_url=url)
 
     card: AgentCard | None = await resolver.get_agent_card()
@@ -68,6 +72,7 @@ async def a2a_send_message(
     message: str,
     task_id: Optional[str] = None,
     context_id: Optional[str] = None,
+    httpx_client: Optional[httpx.AsyncClient] = None,
 ) -> SendMessageResponse:
     """
     Send a message to the A2A server.
@@ -77,12 +82,15 @@ async def a2a_send_message(
         message: The message to send.
         task_id: The task ID.
         context_id: The context ID.
+        httpx_client: Optional shared HTTP client, so repeated calls reuse pooled
+            keep-alive connections. A new one is created if None.
 
     Returns:
         The response from the A2A server.
     """
-    card = await get_agent_card(url)
-    httpx_client = httpx.AsyncClient(timeout=120.0)
+    if httpx_client is None:
+        httpx_client = httpx.AsyncClient(timeout=120.0)
+    card = await get_agent_card(url, httpx_client=httpx_client)
     client = A2AClient(httpx_client=httpx_client, agent_card=card)
 
     message_id = uuid.uuid4().hex
@@ -1,5 +1,8 @@
+import functools
 import re
-from typing import Dict
+from typing import Dict, Optional
+
+_TAG_RE = re.compile(r"<(.*?)>(.*?)</\1>", re.DOTALL)
 
 
 def parse_tags(str_with_tags: str) -> Dict[str, str]:
@@ -12,10 +15,31 @@ def parse_tags(str_with_tags: str) -> Dict[str, str]:
         A dictionary of tags and their contents.
     """
 
-    tags = re.findall(r"<(.*?)>(.*?)</\1>", str_with_tags, re.DOTALL)
+    tags = _TAG_RE.findall(str_with_tags)
     return {tag: content.strip() for tag, content in tags}
 
 
+@functools.lru_cache(maxsize=None)
+def _single_tag_re(tag_name: str) -> re.Pattern:
+    tag = re.escape(tag_name)
+    return re.compile(rf"<{tag}>(.*?)</{tag}>", re.DOTALL)
+
+
+def parse_tag(str_with_tags: str, tag_name: str) -> Optional[str]:
+    """parse out the content of the first <tag_name> ... </tag_name> block, without building the full tag dict
+
+    Args:
+        str_with_tags: The string to parse.
+        tag_name: The tag to look for.
+
+    Returns:
+        The stripped content of the tag, or None if the tag is not present.
+    """
+
+    match = _single_tag_re(tag_name).search(str_with_tags)
+    return match.group(1).strip() if match else None
+
+
 if __name__ == "__main__":
     test_str = "<tag1>Hello</tag1> some text <tag2>World</tag2>"
     print(parse_tags(test_str))
@@ -1,3 +1,4 @@
+import asyncio
 import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -6,7 +7,10 @@ from a2a.types import Message, SendMessageResponse, SendMessageSuccessResponse
 from agentify_tau_bench.green_agent.agent import (
     RESPOND_ACTION_NAME,
     TauGreenAgentExecutor,
+    _get_task_ids_cached,
     ask_agent_to_solve,
+    build_task_prefix,
+    get_task_ids,
     load_agent_card_toml,
     start_green_agent,
     tools_to_str,
@@ -48,6 +52,44 @@ class TestToolsToStr:
         assert parsed[0]["name"] == "tool1"
         assert parsed[1]["name"] == "tool2"
 
+    def test_tools_to_str_cached_per_domain(self):
+        """Test that the serialized schema is reused within a domain."""
+        mock_tool = MagicMock()
+        mock_tool.name = "cached_tool"
+        mock_tool.openai_schema = {"name": "cached_tool"}
+
+        first = tools_to_str([mock_tool], domain="mock")
+        second = tools_to_str([mock_tool], domain="mock")
+
+        assert first is second
+
+    def test_tools_to_str_without_domain_reflects_schema_changes(self):
+        """Test that uncached calls always serialize the current schemas."""
+        mock_tool = MagicMock()
+        mock_tool.name = "changing_tool"
+        mock_tool.openai_schema = {"name": "changing_tool"}
+
+        tools_to_str([mock_tool])
+        mock_tool.openai_schema = {"name": "changed"}
+
+        assert json.loads(tools_to_str([mock_tool]))[0]["name"] == "changed"
+
+
+class TestBuildTaskPrefix:
+    """Test building the constant task description prefix."""
+
+    def test_build_task_prefix(self):
+        """Test that the prefix embeds policy, tools and the respond example."""
+        prefix = build_task_prefix("Be helpful", "[]")
+
+        assert "Be helpful" in prefix
+        assert f'"name": "{RESPOND_ACTION_NAME}"' in prefix
+        assert prefix.endswith("User message: ")
+
+    def test_build_task_prefix_cached(self):
+        """Test that the prefix is built once per policy and tools."""
+        assert build_task_prefix("Policy", "[]") is build_task_prefix("Policy", "[]")
+
 
 class TestAskAgentToSolve:
     """Test the ask_agent_to_solve function."""
@@ -144,6 +186,170 @@ class TestTauGreenAgentExecutor:
             mock_ask.assert_called_once()
             mock_event_queue.enqueue_event.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_execute_runs_all_tasks_concurrently(self):
+        """Test that execute fans out every task and records all rewards."""
+        executor = TauGreenAgentExecutor()
+
+        mock_context = MagicMock()
+        env_config = {
+            "domain": "mock",
+            "task_ids": ["task1", "task2", "task3"],
+            "max_concurrent_tasks": 3,
+        }
+        user_input = f"""
+<white_agent_url>http://localhost:9000</white_agent_url>
+<env_config>{json.dumps(env_config)}</env_config>
+"""
+        mock_context.get_user_input.return_value = user_input
+        mock_event_queue = AsyncMock()
+
+        with (
+            patch("agentify_tau_bench.green_agent.agent.gym.make"),
+            patch(
+                "agentify_tau_bench.green_agent.agent.get_task_ids"
+            ) as mock_get_task_ids,
+            patch(
+                "agentify_tau_bench.green_agent.agent.ask_agent_to_solve"
+            ) as mock_ask,
+        ):
+            mock_get_task_ids.return_value = ["task1", "task2", "task3"]
+
+            mock_simulation = MagicMock()
+            mock_simulation.reward_info.reward = 1
+            mock_ask.return_value = mock_simulation
+
+            await executor.execute(mock_context, mock_event_queue)
+
+            assert mock_ask.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_execute_reports_rewards_in_task_order(self):
+        """Test that results follow the requested task order, not completion order."""
+        executor = TauGreenAgentExecutor()
+
+        mock_context = MagicMock()
+        env_config = {
+            "domain": "mock",
+            "task_ids": ["task1", "task2", "task3"],
+            "max_concurrent_tasks": 3,
+        }
+        user_input = f"""
+<white_agent_url>http://localhost:9000</white_agent_url>
+<env_config>{json.dumps(env_config)}</env_config>
+"""
+        mock_context.get_user_input.return_value = user_input
+        mock_event_queue = AsyncMock()
+
+        async def solve_in_reverse(*args, task_id, **kwargs):
+            # Later tasks finish first
+            await asyncio.sleep({"task1": 0.03, "task2": 0.02, "task3": 0.01}[task_id])
+            mock_simulation = MagicMock()
+            mock_simulation.reward_info.reward = 1
+            return mock_simulation
+
+        with (
+            patch("agentify_tau_bench.green_agent.agent.gym.make"),
+            patch(
+                "agentify_tau_bench.green_agent.agent.get_task_ids"
+            ) as mock_get_task_ids,
+            patch(
+                "agentify_tau_bench.green_agent.agent.ask_agent_to_solve",
+                side_effect=solve_in_reverse,
+            ),
+        ):
+            mock_get_task_ids.return_value = ["task1", "task2", "task3"]
+
+            await executor.execute(mock_context, mock_event_queue)
+
+        result_data = [
+            part.root.data
+            for call in mock_event_queue.enqueue_event.call_args_list
+            if getattr(getattr(call.args[0], "artifact", None), "name", None) == "Result"
+            for part in call.args[0].artifact.parts
+            if hasattr(part.root, "data")
+        ][0]
+        assert list(result_data["task_rewards"]) == ["task1", "task2", "task3"]
+
+    @pytest.mark.asyncio
+    async def test_execute_reuses_envs_across_tasks(self):
+        """Test that sequential tasks reset a pooled env instead of building new ones."""
+        executor = TauGreenAgentExecutor()
+
+        mock_context = MagicMock()
+        env_config = {
+            "domain": "mock",
+            "task_ids": ["task1", "task2", "task3"],
+            "max_concurrent_tasks": 1,
+        }
+        user_input = f"""
+<white_agent_url>http://localhost:9000</white_agent_url>
+<env_config>{json.dumps(env_config)}</env_config>
+"""
+        mock_context.get_user_input.return_value = user_input
+        mock_event_queue = AsyncMock()
+
+        with (
+            patch("agentify_tau_bench.green_agent.agent.gym.make") as mock_gym_make,
+            patch(
+                "agentify_tau_bench.green_agent.agent.get_task_ids"
+            ) as mock_get_task_ids,
+            patch(
+                "agentify_tau_bench.green_agent.agent.ask_agent_to_solve"
+            ) as mock_ask,
+        ):
+            mock_get_task_ids.return_value = ["task1", "task2", "task3"]
+
+            mock_simulation = MagicMock()
+            mock_simulation.reward_info.reward = 1
+            mock_ask.return_value = mock_simulation
+
+            await executor.execute(mock_context, mock_event_queue)
+
+            mock_gym_make.assert_called_once()
+            assert [call.kwargs["task_id"] for call in mock_ask.call_args_list] == [
+                "task1",
+                "task2",
+                "task3",
+            ]
+            # The pooled env is closed once all tasks are done
+            mock_gym_make.return_value.close.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_execute_drops_envs_of_unfinished_tasks(self):
+        """Test that an env whose task returned no result is not reused."""
+        executor = TauGreenAgentExecutor()
+
+        mock_context = MagicMock()
+        env_config = {
+            "domain": "mock",
+            "task_ids": ["task1", "task2"],
+            "max_concurrent_tasks": 1,
+        }
+        user_input = f"""
+<white_agent_url>http://localhost:9000</white_agent_url>
+<env_config>{json.dumps(env_config)}</env_config>
+"""
+        mock_context.get_user_input.return_value = user_input
+        mock_event_queue = AsyncMock()
+
+        with (
+            patch("agentify_tau_bench.green_agent.agent.gym.make") as mock_gym_make,
+            patch(
+                "agentify_tau_bench.green_agent.agent.get_task_ids"
+            ) as mock_get_task_ids,
+            patch(
+                "agentify_tau_bench.green_agent.agent.ask_agent_to_solve"
+            ) as mock_ask,
+        ):
+            mock_get_task_ids.return_value = ["task1", "task2"]
+            mock_ask.return_value = None
+
+            await executor.execute(mock_context, mock_event_queue)
+
+            assert mock_gym_make.call_count == 2
+            mock_gym_make.return_value.close.assert_called()
+
     @pytest.mark.asyncio
     async def test_cancel_not_implemented(self):
         """Test that cancel raises NotImplementedError."""
@@ -179,3 +385,22 @@ class TestStartGreenAgent:
             call_kwargs = mock_run.call_args[1]
             assert call_kwargs["host"] == "localhost"
             assert call_kwargs["port"] == 9001
+
+
+class TestGetTaskIds:
+    """Test the cached task ID lookup."""
+
+    def test_get_task_ids_loads_tasks_once(self):
+        """Test that repeated lookups for the same domain reuse the loaded tasks."""
+        _get_task_ids_cached.cache_clear()
+        task = MagicMock()
+        task.id = "task1"
+        with patch(
+            "agentify_tau_bench.green_agent.agent.get_tasks", return_value=[task]
+        ) as mock_get_tasks:
+            first = get_task_ids("mock", ["task1"])
+            second = get_task_ids("mock", ["task1"])
+
+        assert first == second == ["task1"]
+        mock_get_tasks.assert_called_once()
+        _get_task_ids_cached.cache_clear()
@@ -4,6 +4,7 @@ import pytest
 from agentify_tau_bench.utils import (
     a2a_send_message,
     get_agent_card,
+    parse_tag,
     parse_tags,
     wait_agent_ready,
 )
@@ -53,6 +54,13 @@ class TestParseTags:
         result = parse_tags("<tag1>  content with spaces  </tag1>")
         assert result == {"tag1": "content with spaces"}
 
+    def test_parse_single_named_tag(self):
+        """Test extracting one tag without parsing the others."""
+        text = "<white_agent_url> http://x </white_agent_url><env_config>{}</env_config>"
+        assert parse_tag(text, "white_agent_url") == "http://x"
+        assert parse_tag(text, "env_config") == "{}"
+        assert parse_tag(text, "json") is None
+
 
 class TestA2AUtils:
     """Test the A2A utility functions."""
@@ -154,3 +162,26 @@ class TestA2AUtils:
 
             assert result == mock_response
             mock_client.send_message.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_a2a_send_message_reuses_shared_client(self):
+        """Test that a provided httpx client is used for both card lookup and sending."""
+        shared_client = MagicMock()
+
+        with (
+            patch("agentify_tau_bench.utils.a2a_utils.get_agent_card") as mock_get_card,
+            patch("agentify_tau_bench.utils.a2a_utils.A2AClient") as mock_client_class,
+        ):
+
+            mock_get_card.return_value = MagicMock()
+            mock_client = AsyncMock()
+            mock_client_class.return_value = mock_client
+
+            await a2a_send_message(
+                "http://test-url", "Hello", httpx_client=shared_client
+            )
+
+            mock_get_card.assert_called_once_with(
+                "http://test-url", httpx_client=shared_client
+            )
+            assert mock_client_class.call_args.kwargs["httpx_client"] is shared_client
@@ -1,20 +1,58 @@
 """Data models for the hospitality domain (Berkeley Hot Pot restaurant)."""
 
 import datetime
+import functools
+import sys
 from enum import Enum
-from typing import Any, Dict, List, Optional
-
-from pydantic import Field
-
-from tau2.domains.hospitality.utils import HOSPITALITY_DB_PATH
+from pathlib import Path
+from typing import (
+    Annotated,
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from pydantic import AfterValidator, ConfigDict, Field, PrivateAttr
+
+from tau2.domains.hospitality.utils import (
+    HOSPITALITY_DB_PATH,
+    normalize_code_phrase,
+)
 from tau2.environment.db import DB
 from tau2.utils.pydantic_utils import BaseModelNoExtra
 
 
+# Low-cardinality strings repeated across many records (categories, table IDs,
+# item names, dates) are interned so duplicates share one object.
+InternedStr = Annotated[str, AfterValidator(sys.intern)]
+
+
 # ============== Enums ==============
 
 
-class TableType(str, Enum):
+class _LookupEnum(str, Enum):
+    """String enum with a direct value -> member lookup.
+
+    Tools convert raw strings to members on every call; ``lookup`` reads the
+    member map directly instead of going through ``Enum.__call__``.
+    """
+
+    @classmethod
+    def lookup(cls, value: str):
+        try:
+            return cls._value2member_map_[value]
+        except (KeyError, TypeError):
+            raise ValueError(f"{value!r} is not a valid {cls.__name__}") from None
+
+
+class TableType(_LookupEnum):
     """Type of table in the restaurant."""
 
     A_TYPE = "A"  # Standard 4-person booth
@@ -22,7 +60,7 @@ class TableType(str, Enum):
     C_TYPE = "C"  # Long 8-12 person table
 
 
-class TableStatus(str, Enum):
+class TableStatus(_LookupEnum):
     """Status of a table."""
 
     AVAILABLE = "available"
@@ -31,7 +69,7 @@ class TableStatus(str, Enum):
     CLEANING = "cleaning"
 
 
-class ReservationStatus(str, Enum):
+class ReservationStatus(_LookupEnum):
     """Status of a reservation."""
 
     CONFIRMED = "confirmed"
@@ -41,7 +79,7 @@ class ReservationStatus(str, Enum):
     NO_SHOW = "no_show"
 
 
-class OrderStatus(str, Enum):
+class OrderStatus(_LookupEnum):
     """Status of an order."""
 
     PENDING = "pending"
@@ -51,7 +89,7 @@ class OrderStatus(str, Enum):
     CANCELLED = "cancelled"
 
 
-class MemberTier(str, Enum):
+class MemberTier(_LookupEnum):
     """Membership tier levels."""
 
     BRONZE = "Bronze"
@@ -60,7 +98,7 @@ class MemberTier(str, Enum):
     DIAMOND = "Diamond"
 
 
-class StaffRole(str, Enum):
+class StaffRole(_LookupEnum):
     """Staff role levels with different authorities."""
 
     SERVER = "Server"
@@ -68,7 +106,7 @@ class StaffRole(str, Enum):
     MANAGER = "Manager"
 
 
-class IncidentType(str, Enum):
+class IncidentType(_LookupEnum):
     """Types of service incidents."""
 
     SLOW_SERVICE = "slow_service"
@@ -84,7 +122,7 @@ class IncidentType(str, Enum):
     OTHER = "other"
 
 
-class KitchenStatus(str, Enum):
+class KitchenStatus(_LookupEnum):
     """Kitchen operational status for testing internal coordination scenarios."""
 
     NORMAL = "normal"  # Kitchen operating normally
@@ -102,6 +140,10 @@ class KitchenStatus(str, Enum):
 class SoupBase(BaseModelNoExtra):
     """A soup base option."""
 
+    # Menu data is static during a session; freezing it keeps the cached
+    # allergen profiles and dumps on HospitalityDB from going stale.
+    model_config = ConfigDict(frozen=True)
+
     id: str = Field(description="Unique identifier for the soup base")
     name: str = Field(description="Display name of the soup base")
     spicy_level: int = Field(description="Spiciness level 0-5")
@@ -123,9 +165,11 @@ class SoupBase(BaseModelNoExtra):
 class MenuItem(BaseModelNoExtra):
     """A menu item."""
 
+    model_config = ConfigDict(frozen=True)
+
     id: str = Field(description="Unique identifier")
     name: str = Field(description="Display name")
-    category: str = Field(description="Category (protein, seafood, veggie, etc.)")
+    category: InternedStr = Field(description="Category (protein, seafood, veggie, etc.)")
     price: float = Field(description="Price in USD")
     allergies: List[str] = Field(default_factory=list, description="Common allergens")
     contains_pre_processed: bool = Field(
@@ -190,12 +234,12 @@ class Reservation(BaseModelNoExtra):
     """A table reservation."""
 
     reservation_id: str = Field(description="Unique reservation ID")
-    customer_name: str = Field(description="Name for reservation")
+    customer_name: InternedStr = Field(description="Name for reservation")
     phone: str = Field(description="Contact phone")
     party_size: int = Field(description="Number of guests")
-    date: str = Field(description="Reservation date YYYY-MM-DD")
-    time: str = Field(description="Reservation time HH:MM")
-    table_id: Optional[str] = Field(default=None, description="Assigned table")
+    date: InternedStr = Field(description="Reservation date YYYY-MM-DD")
+    time: InternedStr = Field(description="Reservation time HH:MM")
+    table_id: Optional[InternedStr] = Field(default=None, description="Assigned table")
     status: ReservationStatus = Field(default=ReservationStatus.CONFIRMED)
     special_occasion: Optional[str] = Field(
         default=None, description="Birthday, anniversary, etc."
@@ -210,8 +254,12 @@ class Reservation(BaseModelNoExtra):
 class OrderItem(BaseModelNoExtra):
     """An item in an order."""
 
-    item_id: str = Field(description="Menu item ID")
-    name: str = Field(description="Item name")
+    # Line items are never edited after creation (comps append new ones), so
+    # freeze them: identical items can be shared and hashed.
+    model_config = ConfigDict(frozen=True)
+
+    item_id: InternedStr = Field(description="Menu item ID")
+    name: InternedStr = Field(description="Item name")
     quantity: int = Field(default=1)
     price: float = Field(description="Unit price")
     status: str = Field(default="ordered")
@@ -222,7 +270,7 @@ class Order(BaseModelNoExtra):
     """A customer order."""
 
     order_id: str = Field(description="Unique order ID")
-    table_id: str = Field(description="Table ID")
+    table_id: InternedStr = Field(description="Table ID")
     party_size: int = Field(default=1, description="Number of guests (used for sauce bar charge $2/person)")
     has_member: bool = Field(default=False, description="Whether table has a linked member account")
     customer_id: Optional[str] = Field(default=None)
@@ -319,12 +367,66 @@ class SecretCode(BaseModelNoExtra):
     limit_per_table: int = Field(default=1)
 
 
+class AllergenProfile(NamedTuple):
+    """Lowercased ID, name and allergen sets of a soup base or menu item."""
+
+    record: Union[SoupBase, MenuItem]
+    id: str
+    name: str
+    allergies: FrozenSet[str]
+    hidden_ingredients: FrozenSet[str]
+
+
+def _allergen_profile(record: Union[SoupBase, MenuItem]) -> AllergenProfile:
+    return AllergenProfile(
+        record=record,
+        id=record.id.lower(),
+        name=record.name.lower(),
+        allergies=frozenset(a.lower() for a in record.allergies),
+        hidden_ingredients=frozenset(
+            h.lower() for h in getattr(record, "hidden_ingredients", ())
+        ),
+    )
+
+
+def _bigram_index(names: Sequence[str]) -> Dict[str, FrozenSet[int]]:
+    """Map each 2-character substring to the positions of the names containing it."""
+    index: Dict[str, set] = {}
+    for position, name in enumerate(names):
+        for i in range(len(name) - 1):
+            index.setdefault(name[i : i + 2], set()).add(position)
+    return {bigram: frozenset(positions) for bigram, positions in index.items()}
+
+
+def _substring_candidates(
+    index: Dict[str, FrozenSet[int]], query: str, size: int
+) -> Sequence[int]:
+    """Get, in list order, the positions whose names may contain the query.
+
+    Every name containing the query contains all of its bigrams, so the result is
+    a superset of the real matches; callers confirm with an `in` check.
+    """
+    if len(query) < 2:
+        return range(size)
+    candidates: Optional[FrozenSet[int]] = None
+    for i in range(len(query) - 1):
+        positions = index.get(query[i : i + 2])
+        if not positions:
+            return ()
+        candidates = positions if candidates is None else candidates & positions
+    return sorted(candidates)
+
+
 # ============== Main Database ==============
 
 
 class HospitalityDB(DB):
     """Database for the hospitality domain."""
 
+    # Tools write tracking fields directly on every call, so keep assignment
+    # unvalidated, and build the (large) schema on first use, not at import.
+    model_config = ConfigDict(validate_assignment=False, defer_build=True)
+
     restaurant: RestaurantInfo = Field(default_factory=RestaurantInfo)
     soup_bases: List[SoupBase] = Field(default_factory=list)
     menu_items: List[MenuItem] = Field(default_factory=list)
@@ -483,6 +585,299 @@ class HospitalityDB(DB):
         description="Whether agent offered alternative time slot"
     )
 
+    # Lookup indexes over the list fields. Private so they never reach
+    # model_dump() or the DB hash.
+    _indexes: Dict[tuple, tuple] = PrivateAttr(default_factory=dict)
+
+    # Number of check_kitchen_status calls, used to flag repeated checks
+    _kitchen_check_count: int = PrivateAttr(default=0)
+
+    def _derived(self, collection: str, name: str, build: Callable[[list], Any]) -> Any:
+        """Get a value derived from a list field, rebuilding it when the list changed.
+
+        The cached entry holds the list itself, so reassigning the field (e.g. via
+        update_db) or appending/removing records invalidates it.
+        """
+        records = getattr(self, collection)
+        cached = self._indexes.get((collection, name))
+        if cached is not None and cached[0] is records and cached[1] == len(records):
+            return cached[2]
+        value = build(records)
+        self._indexes[(collection, name)] = (records, len(records), value)
+        return value
+
+    def _index(self, collection: str, key: str) -> Dict[Any, Any]:
+        """Get a key -> record map over a list field.
+
+        The first record wins on duplicate keys, matching the linear scans it
+        replaces.
+        """
+
+        def build(records: list) -> Dict[Any, Any]:
+            index: Dict[Any, Any] = {}
+            for record in records:
+                index.setdefault(getattr(record, key), record)
+            return index
+
+        return self._derived(collection, key, build)
+
+    def _group(self, collection: str, key: str) -> Dict[Any, Tuple[Any, ...]]:
+        """Get a key -> records map over a list field, each group in list order."""
+
+        def build(records: list) -> Dict[Any, Tuple[Any, ...]]:
+            groups: Dict[Any, List[Any]] = {}
+            for record in records:
+                groups.setdefault(getattr(record, key), []).append(record)
+            return {value: tuple(group) for value, group in groups.items()}
+
+        return self._derived(collection, f"group:{key}", build)
+
+    def get_table(self, table_id: str) -> Optional[Table]:
+        """Get a table by ID."""
+        return self._index("tables", "table_id").get(table_id)
+
+    def get_customer(self, customer_id: str) -> Optional[Customer]:
+        """Get a customer by ID."""
+        return self._index("customers", "customer_id").get(customer_id)
+
+    def get_customer_by_phone(self, phone: str) -> Optional[Customer]:
+        """Get a customer by phone number."""
+        return self._index("customers", "phone").get(phone)
+
+    def get_reservation(self, reservation_id: str) -> Optional[Reservation]:
+        """Get a reservation by ID."""
+        return self._index("reservations", "reservation_id").get(reservation_id)
+
+    def get_reservation_by_phone(self, phone: str) -> Optional[Reservation]:
+        """Get the first reservation made with a phone number."""
+        return self._index("reservations", "phone").get(phone)
+
+    def find_reservation_by_name(self, query: str) -> Optional[Reservation]:
+        """Get the first reservation whose lowercased name contains a lowercased query.
+
+        Names are lowercased once per reservation, and only names sharing the
+        query's bigrams are checked.
+        """
+
+        def build(records: list) -> Tuple[Tuple[str, ...], dict]:
+            names = tuple(res.customer_name.lower() for res in records)
+            return names, _bigram_index(names)
+
+        names, bigrams = self._derived("reservations", "names", build)
+        for position in _substring_candidates(bigrams, query, len(names)):
+            if query in names[position]:
+                return self.reservations[position]
+        return None
+
+    def get_reservations_on(self, date: str) -> Tuple[Reservation, ...]:
+        """Get all reservations for a YYYY-MM-DD date, in list order.
+
+        Grouped by date only, since reservation status can change in place;
+        callers filter on status themselves.
+        """
+        return self._group("reservations", "date").get(date, ())
+
+    def get_reservations_for_table(self, table_id: str) -> Tuple[Reservation, ...]:
+        """Get all reservations assigned to a table, in list order."""
+        return self._group("reservations", "table_id").get(table_id, ())
+
+    def get_order(self, order_id: str) -> Optional[Order]:
+        """Get an order by ID."""
+        return self._index("orders", "order_id").get(order_id)
+
+    @property
+    def current_order(self) -> Optional[Order]:
+        """The current table's order, i.e. the most recently added one."""
+        return self.orders[-1] if self.orders else None
+
+    def get_orders_for_table(self, table_id: str) -> Tuple[Order, ...]:
+        """Get all orders placed at a table, in list order."""
+        return self._group("orders", "table_id").get(table_id, ())
+
+    def get_incident_types(self) -> FrozenSet[str]:
+        """Get the values of all incident types recorded so far."""
+        return self._derived(
+            "incidents",
+            "types",
+            lambda records: frozenset(inc.incident_type.value for inc in records),
+        )
+
+    def get_menu_item(self, item_id: str) -> Optional[MenuItem]:
+        """Get a menu item by ID."""
+        return self._index("menu_items", "id").get(item_id)
+
+    def get_menu_item_by_name(self, name: str) -> Optional[MenuItem]:
+        """Get the first menu item with a name, compared case-insensitively."""
+
+        def build(records: list) -> Dict[str, MenuItem]:
+            index: Dict[str, MenuItem] = {}
+            for item in records:
+                index.setdefault(item.name.lower(), item)
+            return index
+
+        return self._derived("menu_items", "lower_name", build).get(name.lower())
+
+    def get_soup_base(self, soup_id: str) -> Optional[SoupBase]:
+        """Get a soup base by ID."""
+        return self._index("soup_bases", "id").get(soup_id)
+
+    def get_inventory_item(self, item_id: str) -> Optional[Inventory]:
+        """Get an inventory item by ID."""
+        return self._index("inventory", "item_id").get(item_id)
+
+    def get_inventory_items_by_name(self, name: str) -> Tuple[Inventory, ...]:
+        """Get all inventory items with a name (case-insensitive), in list order."""
+
+        def build(records: list) -> Dict[str, Tuple[Inventory, ...]]:
+            groups: Dict[str, List[Inventory]] = {}
+            for inv in records:
+                groups.setdefault(inv.name.lower(), []).append(inv)
+            return {key: tuple(group) for key, group in groups.items()}
+
+        return self._derived("inventory", "lower_name", build).get(name.lower(), ())
+
+    def find_inventory_item(self, query: str) -> Optional[Inventory]:
+        """Find the first inventory item matching a lowercased, stripped query.
+
+        An item matches on its exact name or ID (case-insensitive), or, for
+        queries longer than 3 characters, when the query is part of its name.
+        Exact matches come from an index, and substring matches are narrowed to
+        names sharing the query's bigrams before being confirmed, keeping the
+        first match in list order.
+        """
+
+        def build(records: list) -> Tuple[Tuple[str, ...], Dict[str, int], dict]:
+            names = tuple(inv.name.lower() for inv in records)
+            exact: Dict[str, int] = {}
+            for position, inv in enumerate(records):
+                exact.setdefault(names[position], position)
+                exact.setdefault(inv.item_id.lower(), position)
+            return names, exact, _bigram_index(names)
+
+        names, exact, bigrams = self._derived("inventory", "names", build)
+        position = exact.get(query, len(names))
+        if len(query) > 3:
+            for candidate in _substring_candidates(bigrams, query, len(names)):
+                if candidate >= position:
+                    break
+                if query in names[candidate]:
+                    return self.inventory[candidate]
+        return self.inventory[position] if position < len(names) else None
+
+    def get_promotion(self, promo_id: str) -> Optional[Promotion]:
+        """Get a promotion by ID."""
+        return self._index("promotions", "promo_id").get(promo_id)
+
+    def get_secret_code(self, code: str) -> Optional[SecretCode]:
+        """Get a secret code by its exact phrase."""
+        return self._index("secret_codes", "code").get(code)
+
+    def find_secret_code(self, phrase: str) -> Optional[SecretCode]:
+        """Find the first secret code matching a phrase normalized with
+        normalize_code_phrase: either one contains the other.
+
+        Codes are normalized once per list change rather than on every lookup.
+        """
+        codes = self._derived(
+            "secret_codes",
+            "normalized",
+            lambda records: tuple(
+                (normalize_code_phrase(sc.code), sc) for sc in records
+            ),
+        )
+        for code, sc in codes:
+            # Allow partial match if key phrase is contained, or exact match
+            if code in phrase or phrase in code:
+                return sc
+        return None
+
+    def get_staff_authority(self, role: StaffRole) -> Optional[StaffAuthority]:
+        """Get the authority levels for a staff role."""
+        return self._index("staff_authorities", "role").get(role)
+
+    def get_menu_item_dumps(
+        self, category: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Get model_dump() of all menu items, or of one category (case-insensitive).
+
+        Menu items are static during a session, so the dumps are cached and only
+        rebuilt when items are added, removed or the list is replaced. Each call
+        returns fresh copies, so callers may mutate them.
+        """
+
+        def build(records: list) -> Dict[Optional[str], Tuple[Dict[str, Any], ...]]:
+            by_category: Dict[Optional[str], List[Dict[str, Any]]] = {None: []}
+            for item in records:
+                dumped = item.model_dump()
+                by_category[None].append(dumped)
+                by_category.setdefault(item.category.lower(), []).append(dumped)
+            return {key: tuple(dumps) for key, dumps in by_category.items()}
+
+        dumps = self._derived("menu_items", "dumps", build)
+        return [
+            {**dumped, "allergies": list(dumped["allergies"])}
+            for dumped in dumps.get(None if category is None else category.lower(), ())
+        ]
+
+    def get_allergen_profiles(self, collection: str) -> Tuple[AllergenProfile, ...]:
+        """Get lowercased allergen profiles for "soup_bases" or "menu_items", in list order.
+
+        Allergen lists are static menu data, so profiles are only rebuilt when
+        records are added, removed or the list is replaced.
+        """
+        return self._derived(
+            collection,
+            "allergen_profiles",
+            lambda records: tuple(_allergen_profile(r) for r in records),
+        )
+
+    def find_allergen_profile(
+        self, collection: str, query: str
+    ) -> Optional[AllergenProfile]:
+        """Find the first soup base or menu item whose ID equals, or whose name
+        contains, a lowercased query.
+
+        Name matches are narrowed to names sharing the query's bigrams before
+        being confirmed, keeping the first match in list order.
+        """
+
+        def build(records: list) -> Tuple[Dict[str, int], dict]:
+            profiles = self.get_allergen_profiles(collection)
+            by_id: Dict[str, int] = {}
+            for position, profile in enumerate(profiles):
+                by_id.setdefault(profile.id, position)
+            return by_id, _bigram_index([profile.name for profile in profiles])
+
+        profiles = self.get_allergen_profiles(collection)
+        by_id, bigrams = self._derived(collection, "allergen_search", build)
+        exact = by_id.get(query, len(profiles))
+        for position in _substring_candidates(bigrams, query, len(profiles)):
+            if position >= exact:
+                break
+            if query in profiles[position].name:
+                return profiles[position]
+        return profiles[exact] if exact < len(profiles) else None
+
+    @classmethod
+    def load(cls, path: str) -> "HospitalityDB":
+        """Load the database, decoding JSON files in a single pydantic-core pass."""
+        path = Path(path)
+        if path.suffix == ".json":
+            return cls.model_validate_json(path.read_bytes())
+        return super().load(path)
+
+    def dump(self, path: str, exclude_defaults: bool = False, **kwargs: Any) -> None:
+        """Dump the database, serializing JSON files in a single pydantic-core pass."""
+        path = Path(path)
+        if path.suffix == ".json" and set(kwargs) <= {"indent"}:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(
+                self.model_dump_json(exclude_defaults=exclude_defaults, **kwargs),
+                encoding="utf-8",
+            )
+            return
+        super().dump(path, exclude_defaults=exclude_defaults, **kwargs)
+
     def get_statistics(self) -> Dict[str, Any]:
         """Get database statistics."""
         return {
@@ -498,9 +893,19 @@ class HospitalityDB(DB):
         }
 
 
+@functools.lru_cache(maxsize=4)
+def _read_db_bytes(path: str) -> bytes:
+    """Read a database file once per process; the file does not change during a run."""
+    return Path(path).read_bytes()
+
+
 def get_db() -> HospitalityDB:
-    """Get an instance of the hospitality database."""
-    return HospitalityDB.load(HOSPITALITY_DB_PATH)
+    """Get a fresh instance of the hospitality database.
+
+    The file bytes are cached, but every call validates into new model objects,
+    so callers that mutate the DB never share state.
+    """
+    return HospitalityDB.model_validate_json(_read_db_bytes(str(HOSPITALITY_DB_PATH)))
 
 
 if __name__ == "__main__":
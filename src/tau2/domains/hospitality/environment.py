@@ -1,15 +1,14 @@
 """Environment for the hospitality domain."""
 
+from __future__ import annotations
+
+import functools
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
+
+from pydantic import TypeAdapter
 
-from tau2.data_model.tasks import Task
-from tau2.domains.hospitality.data_model import HospitalityDB
-from tau2.domains.hospitality.tools import HospitalityTools
-from tau2.domains.hospitality.user_data_model import HospitalityUserDB
-from tau2.domains.hospitality.user_tools import HospitalityUserTools
 from tau2.domains.hospitality.utils import (
-    HOSPITALITY_DB_PATH,
     HOSPITALITY_POLICY_PATH,
     HOSPITALITY_TASK_SET_PATH,
     HOSPITALITY_USER_DB_PATH,
@@ -17,6 +16,16 @@ from tau2.domains.hospitality.utils import (
 from tau2.environment.environment import Environment
 from tau2.utils import load_file
 
+# The domain models and toolkits are imported lazily in get_environment/load_tasks:
+# the registry imports every domain's environment module, and building their
+# pydantic schemas is wasted start-up time when another domain is in use.
+if TYPE_CHECKING:
+    from tau2.data_model.tasks import Task
+    from tau2.domains.hospitality.data_model import HospitalityDB
+    from tau2.domains.hospitality.tools import HospitalityTools
+    from tau2.domains.hospitality.user_data_model import HospitalityUserDB
+    from tau2.domains.hospitality.user_tools import HospitalityUserTools
+
 
 class HospitalityEnvironment(Environment):
     """Environment for the hospitality domain."""
@@ -42,15 +51,14 @@ class HospitalityEnvironment(Environment):
         if self.user_tools.db.context.phone:
             phone = self.user_tools.db.context.phone
             # Try to find matching customer in agent DB
-            for customer in self.tools.db.customers:
-                if customer.phone == phone:
-                    # Update user context with customer info
-                    self.user_tools.db.context.membership_tier = customer.tier.value
-                    self.user_tools.db.context.points_balance = customer.points
-                    self.user_tools.db.context.previous_visit_count = (
-                        customer.visit_count
-                    )
-                    break
+            customer = self.tools.db.get_customer_by_phone(phone)
+            if customer is not None:
+                # Update user context with customer info
+                self.user_tools.db.context.membership_tier = customer.tier.value
+                self.user_tools.db.context.points_balance = customer.points
+                self.user_tools.db.context.previous_visit_count = (
+                    customer.visit_count
+                )
 
 
 def get_environment(
@@ -69,8 +77,13 @@ def get_environment(
     Returns:
         Configured HospitalityEnvironment instance.
     """
+    from tau2.domains.hospitality.data_model import get_db
+    from tau2.domains.hospitality.tools import HospitalityTools
+    from tau2.domains.hospitality.user_data_model import HospitalityUserDB
+    from tau2.domains.hospitality.user_tools import HospitalityUserTools
+
     if db is None:
-        db = HospitalityDB.load(HOSPITALITY_DB_PATH)
+        db = get_db()
     tools = HospitalityTools(db)
 
     if user_db is None:
@@ -80,13 +93,9 @@ def get_environment(
             user_db = HospitalityUserDB()
     user_tools = HospitalityUserTools(user_db)
 
-    # Load policy
-    with open(HOSPITALITY_POLICY_PATH, "r") as fp:
-        policy = fp.read()
-
     env = HospitalityEnvironment(
         domain_name="hospitality",
-        policy=policy,
+        policy=_load_policy(),
         tools=tools,
         user_tools=user_tools,
     )
@@ -97,22 +106,57 @@ def get_environment(
     return env
 
 
-def load_tasks(path: str) -> list[Task]:
-    """Load tasks from a data file."""
+@functools.cache
+def _load_policy() -> str:
+    """Read the policy once per process; it does not change during a run."""
+    with open(HOSPITALITY_POLICY_PATH, "r") as fp:
+        return fp.read()
+
+
+@functools.cache
+def _task_list_adapter() -> TypeAdapter:
+    """Build the list[Task] validator once, on first use."""
+    from tau2.data_model.tasks import Task
+
+    return TypeAdapter(list[Task])
+
+
+@functools.cache
+def _load_tasks_cached(path: str) -> tuple[Task, ...]:
     tasks = load_file(path)
     if isinstance(tasks, dict) and "tasks" in tasks:
         tasks = tasks["tasks"]
-    return [Task.model_validate(task) for task in tasks]
+    # Validate the whole list in one pydantic-core call
+    return tuple(_task_list_adapter().validate_python(tasks))
 
 
-def load_tasks_split(path: str) -> Optional[dict[str, list[str]]]:
-    """Load tasks split from a data file."""
+def load_tasks(path: str) -> list[Task]:
+    """Load tasks from a data file.
+
+    The file is parsed once per path; each call returns a new list of the cached tasks.
+    """
+    return list(_load_tasks_cached(str(path)))
+
+
+@functools.cache
+def _load_tasks_split_cached(path: str) -> Optional[dict[str, list[str]]]:
     split_file = Path(path).parent / f"split_{Path(path).stem}.json"
     if split_file.exists():
         return load_file(split_file)
     return None
 
 
+def load_tasks_split(path: str) -> Optional[dict[str, list[str]]]:
+    """Load tasks split from a data file.
+
+    The file is parsed once per path; each call returns a copy callers may modify.
+    """
+    task_splits = _load_tasks_split_cached(str(path))
+    if task_splits is None:
+        return None
+    return {name: list(task_ids) for name, task_ids in task_splits.items()}
+
+
 def get_tasks(task_split_name: Optional[str] = "base") -> list[Task]:
     """
     Get tasks for the hospitality domain.
@@ -138,7 +182,8 @@ def get_tasks(task_split_name: Optional[str] = "base") -> list[Task]:
             f"Valid splits are: {list(task_splits.keys())}"
         )
 
-    return [task for task in tasks if task.id in task_splits[task_split_name]]
+    split_ids = frozenset(task_splits[task_split_name])
+    return [task for task in tasks if task.id in split_ids]
 
 
 def get_tasks_split() -> Optional[dict[str, list[str]]]:
@@ -1,8 +1,9 @@
 """Toolkit for the hospitality domain (Berkeley Hot Pot restaurant)."""
 
+import functools
 import hashlib
 from datetime import date, datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
 
 from loguru import logger
 
@@ -29,14 +30,157 @@ from tau2.domains.hospitality.data_model import (
     TableType,
 )
 from tau2.domains.hospitality.utils import (
+    classify_date,
+    classify_time_slot,
     get_now,
     get_today,
     is_federal_holiday,
     is_lunch_time,
     is_weekday,
+    normalize_code_phrase,
 )
 from tau2.environment.toolkit import ToolKitBase, ToolType, is_tool
 
+# Berkeley sales tax and the per-guest sauce bar charge
+TAX_RATE = 0.0875
+SAUCE_BAR_CHARGE_PER_PERSON = 2.0
+
+# Lowercase phrases that expose internal issues when said to a customer
+FORBIDDEN_DELAY_PHRASES: Tuple[str, ...] = (
+    "kitchen refused", "staff won't", "cook said no",
+    "they're not cooperating", "kitchen attitude", "chef quit",
+    "staff walked out", "they said", "kitchen staff", "cook is",
+    "they won't", "back of house", "boh", "they're being",
+    "not my fault", "their fault", "kitchen's fault",
+)
+
+# Customer moods in which membership should not be promoted
+NO_MEMBERSHIP_OFFER_MOODS: FrozenSet[str] = frozenset({"upset", "rushing"})
+
+# Occupancy presets for set_restaurant_occupancy: level -> (occupied tables as
+# {table-ID prefix: highest table number}, where "*" matches any prefix and None
+# means every number; table IDs always left available; result message).
+OCCUPANCY_PRESETS: Dict[str, Tuple[Dict[str, Optional[int]], FrozenSet[str], str]] = {
+    "empty": ({}, frozenset(), "Restaurant set to empty - all tables available"),
+    # 30% - occupy A1-A6
+    "light": ({"A": 6}, frozenset(), "Restaurant set to light occupancy (~30%)"),
+    # 50% - occupy A1-A10, B1-B4
+    "moderate": (
+        {"A": 10, "B": 4},
+        frozenset(),
+        "Restaurant set to moderate occupancy (~50%)",
+    ),
+    # 75% - occupy A1-A15, B1-B6, C1
+    "busy": ({"A": 15, "B": 6, "C": 1}, frozenset(), "Restaurant set to busy (~75%)"),
+    # All occupied except C2
+    "full": (
+        {"*": None},
+        frozenset({"C2"}),
+        "Restaurant set to full - only C2 available",
+    ),
+    # All tables occupied including large tables
+    "peak_no_large": (
+        {"*": None},
+        frozenset(),
+        "Restaurant set to peak - no large tables available",
+    ),
+}
+
+# Party size seated at an occupied table by table-ID prefix (large C tables: 10)
+OCCUPIED_PARTY_SIZE = {"A": 4, "B": 6}
+
+
+# Fit-specific fields of a check_table_availability entry
+TABLE_FIT_DETAILS: Dict[str, Dict[str, Any]] = {
+    # Fits within standard capacity - best option
+    "standard": {"fit_type": "standard", "recommended": True},
+    # Fits with default extra chairs - good option
+    "expansion": {
+        "fit_type": "expansion",
+        "recommended": True,
+        "note": "Will add extra chairs (standard practice)",
+    },
+    # Only fits with squeeze - not recommended
+    "squeeze": {
+        "fit_type": "squeeze",
+        "recommended": False,
+        "note": "Would require squeezing beyond standard - not recommended, may be uncomfortable. Only offer if customer is a regular AND proactively requests it.",
+    },
+}
+
+
+def _table_availability_entry(
+    table_id: str,
+    table_type: str,
+    std_capacity: int,
+    std_expansion: int,
+    max_squeeze: int,
+    fit_type: str,
+) -> Dict[str, Any]:
+    """Build a new check_table_availability entry."""
+    return {
+        "table_id": table_id,
+        "type": table_type,
+        "std_capacity": std_capacity,
+        "std_expansion": std_expansion,
+        "max_squeeze": max_squeeze,
+        **TABLE_FIT_DETAILS[fit_type],
+    }
+
+
+@functools.lru_cache(maxsize=8)
+def _lunch_special_status(today: date, now: datetime) -> Dict[str, Any]:
+    """Get the clock-dependent fields of check_lunch_special_availability.
+
+    The simulation clock is fixed, so this is computed once per (date, time).
+    """
+    is_holiday = is_federal_holiday(today)
+    is_wkday = is_weekday(today)
+    is_lunch = is_lunch_time(now)
+
+    available = is_wkday and is_lunch and not is_holiday
+
+    reason = None
+    if is_holiday:
+        reason = "Lunch special is not available on federal holidays."
+    elif not is_wkday:
+        reason = "Lunch special is only available Monday through Friday."
+    elif not is_lunch:
+        reason = "Lunch special is only available before 5 PM."
+
+    return {
+        "available": available,
+        "current_date": str(today),
+        "current_time": now.strftime("%H:%M"),
+        "is_federal_holiday": is_holiday,
+        "is_weekday": is_wkday,
+        "is_before_5pm": is_lunch,
+        "reason": reason,
+    }
+
+
+@functools.lru_cache(maxsize=32)
+def _occupancy_plan(
+    occupancy_level: str, table_ids: Tuple[str, ...]
+) -> Tuple[int, ...]:
+    """Get the party size per table for an occupancy preset (0 = available).
+
+    Unknown levels leave every table available.
+    """
+    preset = OCCUPANCY_PRESETS.get(occupancy_level)
+    if preset is None:
+        return (0,) * len(table_ids)
+    limits, kept_free, _ = preset
+    party_sizes = []
+    for table_id in table_ids:
+        prefix = table_id[:1]
+        limit = limits.get(prefix, limits.get("*", 0))
+        occupied = table_id not in kept_free and (
+            limit is None or (limit and int(table_id[1:]) <= limit)
+        )
+        party_sizes.append(OCCUPIED_PARTY_SIZE.get(prefix, 10) if occupied else 0)
+    return tuple(party_sizes)
+
 
 class HospitalityTools(ToolKitBase):
     """Tools for the hospitality domain."""
@@ -66,8 +210,7 @@ class HospitalityTools(ToolKitBase):
             party_size: Number of guests (sauce bar charge = $2 per person)
             order_id: Optional custom order ID (default: auto-generated)
         """
-        from datetime import datetime
-        sauce_bar_charge = party_size * 2.0  # $2 per person
+        sauce_bar_charge = party_size * SAUCE_BAR_CHARGE_PER_PERSON
         subtotal_with_sauce = bill_amount + sauce_bar_charge
         
         final_order_id = order_id if order_id else self._generate_id("ORD", table_id, bill_amount)
@@ -79,8 +222,8 @@ class HospitalityTools(ToolKitBase):
             items=[],
             subtotal=bill_amount,
             sauce_bar_charge=sauce_bar_charge,
-            tax=subtotal_with_sauce * 0.0875,
-            total=subtotal_with_sauce * 1.0875,
+            tax=subtotal_with_sauce * TAX_RATE,
+            total=subtotal_with_sauce * (1 + TAX_RATE),
             status=OrderStatus.IN_PROGRESS,
             created_at="2026-01-01T12:00:00",  # Fixed timestamp for deterministic evaluation
         )
@@ -91,13 +234,13 @@ class HospitalityTools(ToolKitBase):
         """Initialize customer with specific points balance. Used for test setup."""
         # Normalize tier to proper case (e.g., "gold" -> "Gold")
         tier_normalized = tier.capitalize()
-        member_tier = MemberTier(tier_normalized)
+        member_tier = MemberTier.lookup(tier_normalized)
         
-        for customer in self.db.customers:
-            if customer.customer_id == customer_id:
-                customer.points = points
-                customer.tier = member_tier
-                return f"Customer {customer_id} points set to {points}"
+        customer = self.db.get_customer(customer_id)
+        if customer is not None:
+            customer.points = points
+            customer.tier = member_tier
+            return f"Customer {customer_id} points set to {points}"
         # Create new customer if not exists
         customer = Customer(
             customer_id=customer_id,
@@ -170,8 +313,9 @@ class HospitalityTools(ToolKitBase):
         Args:
             has_member: Whether table already has member linked
         """
-        if self.db.orders:
-            self.db.orders[-1].has_member = has_member
+        order = self.db.current_order
+        if order is not None:
+            order.has_member = has_member
         return f"Table membership set: has_member={has_member}"
 
     def set_customer_mood(self, mood: str = "normal") -> str:
@@ -199,12 +343,12 @@ class HospitalityTools(ToolKitBase):
             status: Table status - "available", "occupied", "reserved", "cleaning"
             party_size: Current party size if occupied (default 0)
         """
-        for table in self.db.tables:
-            if table.table_id == table_id:
-                table.status = TableStatus(status)
-                table.current_party_size = party_size
-                return f"Table {table_id} set to {status} (party: {party_size})"
-        return f"Table {table_id} not found"
+        table = self.db.get_table(table_id)
+        if table is None:
+            return f"Table {table_id} not found"
+        table.status = TableStatus.lookup(status)
+        table.current_party_size = party_size
+        return f"Table {table_id} set to {status} (party: {party_size})"
 
     def set_restaurant_occupancy(self, occupancy_level: str) -> str:
         """
@@ -220,140 +364,89 @@ class HospitalityTools(ToolKitBase):
                 - "full": All tables occupied except C2
                 - "peak_no_large": All tables occupied, no large tables available
         """
-        # Reset all tables to available first
-        for table in self.db.tables:
-            table.status = TableStatus.AVAILABLE
-            table.current_party_size = 0
-        
-        if occupancy_level == "empty":
-            return "Restaurant set to empty - all tables available"
-        
-        elif occupancy_level == "light":
-            # 30% - occupy A1-A6
-            for table in self.db.tables:
-                if table.table_id in ["A1", "A2", "A3", "A4", "A5", "A6"]:
-                    table.status = TableStatus.OCCUPIED
-                    table.current_party_size = 4
-            return "Restaurant set to light occupancy (~30%)"
-        
-        elif occupancy_level == "moderate":
-            # 50% - occupy A1-A10, B1-B4
-            for table in self.db.tables:
-                if table.table_id.startswith("A") and int(table.table_id[1:]) <= 10:
-                    table.status = TableStatus.OCCUPIED
-                    table.current_party_size = 4
-                elif table.table_id in ["B1", "B2", "B3", "B4"]:
-                    table.status = TableStatus.OCCUPIED
-                    table.current_party_size = 6
-            return "Restaurant set to moderate occupancy (~50%)"
-        
-        elif occupancy_level == "busy":
-            # 75% - occupy A1-A15, B1-B6, C1
-            for table in self.db.tables:
-                if table.table_id.startswith("A") and int(table.table_id[1:]) <= 15:
-                    table.status = TableStatus.OCCUPIED
-                    table.current_party_size = 4
-                elif table.table_id in ["B1", "B2", "B3", "B4", "B5", "B6"]:
-                    table.status = TableStatus.OCCUPIED
-                    table.current_party_size = 6
-                elif table.table_id == "C1":
-                    table.status = TableStatus.OCCUPIED
-                    table.current_party_size = 10
-            return "Restaurant set to busy (~75%)"
-        
-        elif occupancy_level == "full":
-            # All occupied except C2
-            for table in self.db.tables:
-                if table.table_id != "C2":
-                    table.status = TableStatus.OCCUPIED
-                    if table.table_id.startswith("A"):
-                        table.current_party_size = 4
-                    elif table.table_id.startswith("B"):
-                        table.current_party_size = 6
-                    else:
-                        table.current_party_size = 10
-            return "Restaurant set to full - only C2 available"
-        
-        elif occupancy_level == "peak_no_large":
-            # All tables occupied including large tables
-            for table in self.db.tables:
-                table.status = TableStatus.OCCUPIED
-                if table.table_id.startswith("A"):
-                    table.current_party_size = 4
-                elif table.table_id.startswith("B"):
-                    table.current_party_size = 6
-                else:
-                    table.current_party_size = 10
-            return "Restaurant set to peak - no large tables available"
-        
-        return f"Unknown occupancy level: {occupancy_level}"
+        tables = self.db.tables
+        party_sizes = _occupancy_plan(
+            occupancy_level, tuple(table.table_id for table in tables)
+        )
+        # Every table is reset: occupied with its party size, or available
+        for table, party_size in zip(tables, party_sizes):
+            table.status = TableStatus.OCCUPIED if party_size else TableStatus.AVAILABLE
+            table.current_party_size = party_size
+
+        if occupancy_level not in OCCUPANCY_PRESETS:
+            return f"Unknown occupancy level: {occupancy_level}"
+        return OCCUPANCY_PRESETS[occupancy_level][2]
 
     # ============== End Initialization Methods ==============
 
     def _get_table_by_id(self, table_id: str) -> Table:
         """Get a table by ID."""
-        for table in self.db.tables:
-            if table.table_id == table_id:
-                return table
-        raise ValueError(f"Table {table_id} not found")
+        table = self.db.get_table(table_id)
+        if table is None:
+            raise ValueError(f"Table {table_id} not found")
+        return table
 
     def _get_customer_by_id(self, customer_id: str) -> Customer:
         """Get a customer by ID."""
-        for customer in self.db.customers:
-            if customer.customer_id == customer_id:
-                return customer
-        raise ValueError(f"Customer {customer_id} not found")
+        customer = self.db.get_customer(customer_id)
+        if customer is None:
+            raise ValueError(f"Customer {customer_id} not found")
+        return customer
 
     def _get_reservation_by_id(self, reservation_id: str) -> Reservation:
         """Get a reservation by ID."""
-        for res in self.db.reservations:
-            if res.reservation_id == reservation_id:
-                return res
-        raise ValueError(f"Reservation {reservation_id} not found")
+        res = self.db.get_reservation(reservation_id)
+        if res is None:
+            raise ValueError(f"Reservation {reservation_id} not found")
+        return res
 
     def _get_order_by_id(self, order_id: str) -> Order:
         """Get an order by ID."""
-        for order in self.db.orders:
-            if order.order_id == order_id:
-                return order
-        raise ValueError(f"Order {order_id} not found")
+        order = self.db.get_order(order_id)
+        if order is None:
+            raise ValueError(f"Order {order_id} not found")
+        return order
 
     def _get_menu_item_by_id(self, item_id: str) -> MenuItem:
         """Get a menu item by ID."""
-        for item in self.db.menu_items:
-            if item.id == item_id:
-                return item
-        raise ValueError(f"Menu item {item_id} not found")
+        item = self.db.get_menu_item(item_id)
+        if item is None:
+            raise ValueError(f"Menu item {item_id} not found")
+        return item
 
     def _get_soup_base_by_id(self, soup_id: str) -> SoupBase:
         """Get a soup base by ID."""
-        for soup in self.db.soup_bases:
-            if soup.id == soup_id:
-                return soup
-        raise ValueError(f"Soup base {soup_id} not found")
+        soup = self.db.get_soup_base(soup_id)
+        if soup is None:
+            raise ValueError(f"Soup base {soup_id} not found")
+        return soup
 
     def _get_inventory_by_id(self, item_id: str) -> Inventory:
         """Get inventory item by ID."""
-        for inv in self.db.inventory:
-            if inv.item_id == item_id:
-                return inv
-        raise ValueError(f"Inventory item {item_id} not found")
+        inv = self.db.get_inventory_item(item_id)
+        if inv is None:
+            raise ValueError(f"Inventory item {item_id} not found")
+        return inv
 
     def _get_staff_authority(self, role: StaffRole) -> StaffAuthority:
         """Get authority for a staff role."""
-        for auth in self.db.staff_authorities:
-            if auth.role == role:
-                return auth
-        raise ValueError(f"Authority for {role} not found")
+        auth = self.db.get_staff_authority(role)
+        if auth is None:
+            raise ValueError(f"Authority for {role} not found")
+        return auth
 
     def _generate_id(self, prefix: str, *args: Any) -> str:
         """
         Generate a deterministic ID based on prefix and input arguments.
         This ensures reproducibility when replaying tool calls during evaluation.
         """
-        # Create a deterministic hash from the prefix and all arguments
-        hash_input = f"{prefix}:{':'.join(str(arg) for arg in args)}"
-        hash_value = hashlib.md5(hash_input.encode()).hexdigest()[:8]
+        # Create a deterministic hash from the prefix and all arguments. The digest
+        # is only an ID, not a security measure, and must stay md5 so IDs match
+        # those recorded in existing tasks and trajectories.
+        hash_input = f"{prefix}:{':'.join(map(str, args))}"
+        hash_value = hashlib.md5(
+            hash_input.encode(), usedforsecurity=False
+        ).hexdigest()[:8]
         return f"{prefix}_{hash_value}"
 
     # ============== READ Tools ==============
@@ -397,14 +490,8 @@ class HospitalityTools(ToolKitBase):
                 for sb in self.db.soup_bases
             ]
 
-        if category is None:
-            result["menu_items"] = [item.model_dump() for item in self.db.menu_items]
-        elif category != "soup_base":
-            result["menu_items"] = [
-                item.model_dump()
-                for item in self.db.menu_items
-                if item.category.lower() == category.lower()
-            ]
+        if category != "soup_base":
+            result["menu_items"] = self.db.get_menu_item_dumps(category)
 
         if self.db.lunch_special:
             result["lunch_special"] = self.db.lunch_special.model_dump()
@@ -432,72 +519,43 @@ class HospitalityTools(ToolKitBase):
         available_tables = []
 
         # Get reservations for this date/time
-        reserved_tables = set()
-        for res in self.db.reservations:
-            if res.date == date_str and res.status == ReservationStatus.CONFIRMED:
-                if res.table_id:
-                    reserved_tables.add(res.table_id)
+        reserved_tables = {
+            res.table_id
+            for res in self.db.get_reservations_on(date_str)
+            if res.status == ReservationStatus.CONFIRMED and res.table_id
+        }
 
+        available = TableStatus.AVAILABLE
         for table in self.db.tables:
-            if table.table_id in reserved_tables:
+            table_id = table.table_id
+            if table_id in reserved_tables or table.status != available:
                 continue
-            if table.status == TableStatus.AVAILABLE:
-                if table.std_capacity >= party_size:
-                    # Fits within standard capacity - best option
-                    available_tables.append(
-                        {
-                            "table_id": table.table_id,
-                            "type": table.table_type.value,
-                            "std_capacity": table.std_capacity,
-                            "std_expansion": table.std_expansion,
-                            "max_squeeze": table.max_squeeze,
-                            "fit_type": "standard",
-                            "recommended": True,
-                        }
-                    )
-                elif table.std_expansion >= party_size:
-                    # Fits with default extra chairs - good option
-                    available_tables.append(
-                        {
-                            "table_id": table.table_id,
-                            "type": table.table_type.value,
-                            "std_capacity": table.std_capacity,
-                            "std_expansion": table.std_expansion,
-                            "max_squeeze": table.max_squeeze,
-                            "fit_type": "expansion",
-                            "recommended": True,
-                            "note": "Will add extra chairs (standard practice)",
-                        }
-                    )
-                elif table.max_squeeze >= party_size:
-                    # Only fits with squeeze - not recommended
-                    available_tables.append(
-                        {
-                            "table_id": table.table_id,
-                            "type": table.table_type.value,
-                            "std_capacity": table.std_capacity,
-                            "std_expansion": table.std_expansion,
-                            "max_squeeze": table.max_squeeze,
-                            "fit_type": "squeeze",
-                            "recommended": False,
-                            "note": "Would require squeezing beyond standard - not recommended, may be uncomfortable. Only offer if customer is a regular AND proactively requests it.",
-                        }
-                    )
+            std_capacity = table.std_capacity
+            std_expansion = table.std_expansion
+            max_squeeze = table.max_squeeze
+            if std_capacity >= party_size:
+                fit_type = "standard"
+            elif std_expansion >= party_size:
+                fit_type = "expansion"
+            elif max_squeeze >= party_size:
+                fit_type = "squeeze"
+            else:
+                continue
+            available_tables.append(
+                _table_availability_entry(
+                    table_id,
+                    table.table_type.value,
+                    std_capacity,
+                    std_expansion,
+                    max_squeeze,
+                    fit_type,
+                )
+            )
 
         # Determine if this is peak hours
-        check_date = datetime.strptime(date_str, "%Y-%m-%d").date()
-        is_weekend = check_date.weekday() >= 5
-        is_holiday = is_federal_holiday(check_date)
-        
         # Peak hours: Friday 6-9pm, Saturday 5-9pm, Sunday 5-8pm
         hour = int(time_str.split(":")[0])
-        is_peak = False
-        if check_date.weekday() == 4 and 18 <= hour <= 21:  # Friday
-            is_peak = True
-        elif check_date.weekday() == 5 and 17 <= hour <= 21:  # Saturday
-            is_peak = True
-        elif check_date.weekday() == 6 and 17 <= hour <= 20:  # Sunday
-            is_peak = True
+        is_peak, is_weekend, is_holiday = classify_time_slot(date_str, hour)
         
         result = {
             "party_size": party_size,
@@ -535,10 +593,10 @@ class HospitalityTools(ToolKitBase):
             return self._get_customer_by_id(customer_id)
 
         if phone:
-            for customer in self.db.customers:
-                if customer.phone == phone:
-                    return customer
-            raise ValueError(f"Customer with phone {phone} not found")
+            customer = self.db.get_customer_by_phone(phone)
+            if customer is None:
+                raise ValueError(f"Customer with phone {phone} not found")
+            return customer
 
         raise ValueError("Must provide either customer_id or phone")
 
@@ -560,52 +618,52 @@ class HospitalityTools(ToolKitBase):
         item_id_lower = item_id.lower()
 
         # Check soup bases (by ID or name, partial match)
-        for soup in self.db.soup_bases:
-            if soup.id.lower() == item_id_lower or item_id_lower in soup.name.lower():
-                known_safe = allergy_lower not in [a.lower() for a in soup.allergies]
-                has_hidden = len(soup.hidden_ingredients) > 0
-                hidden_risk = allergy_lower in [
-                    h.lower() for h in soup.hidden_ingredients
-                ]
-
-                if soup.name == "Plain Water":
-                    return {
-                        "item": soup.name,
-                        "is_safe": True,
-                        "known_allergens": [],
-                        "hidden_ingredients": [],
-                        "recommendation": "Plain Water is the safest option for severe allergies.",
-                    }
-
+        profile = self.db.find_allergen_profile("soup_bases", item_id_lower)
+        if profile is not None:
+            soup = profile.record
+            known_safe = allergy_lower not in profile.allergies
+            has_hidden = len(soup.hidden_ingredients) > 0
+            hidden_risk = allergy_lower in profile.hidden_ingredients
+
+            if soup.name == "Plain Water":
                 return {
                     "item": soup.name,
-                    "is_safe": known_safe and not hidden_risk,
-                    "known_allergens": soup.allergies,
-                    "hidden_ingredients": soup.hidden_ingredients,
-                    "has_hidden_ingredient_risk": has_hidden,
-                    "recommendation": (
-                        "CANNOT GUARANTEE SAFETY. Due to possible hidden ingredients in pre-made sauces "
-                        "and cross-contamination risks, we strongly recommend Plain Water base for "
-                        "customers with severe or life-threatening allergies."
-                        if has_hidden or not known_safe
-                        else "Appears safe based on known ingredients, but please inform us of your allergy."
-                    ),
+                    "is_safe": True,
+                    "known_allergens": [],
+                    "hidden_ingredients": [],
+                    "recommendation": "Plain Water is the safest option for severe allergies.",
                 }
 
+            return {
+                "item": soup.name,
+                "is_safe": known_safe and not hidden_risk,
+                "known_allergens": soup.allergies,
+                "hidden_ingredients": soup.hidden_ingredients,
+                "has_hidden_ingredient_risk": has_hidden,
+                "recommendation": (
+                    "CANNOT GUARANTEE SAFETY. Due to possible hidden ingredients in pre-made sauces "
+                    "and cross-contamination risks, we strongly recommend Plain Water base for "
+                    "customers with severe or life-threatening allergies."
+                    if has_hidden or not known_safe
+                    else "Appears safe based on known ingredients, but please inform us of your allergy."
+                ),
+            }
+
         # Check menu items (by ID or name, partial match)
-        for item in self.db.menu_items:
-            if item.id.lower() == item_id_lower or item_id_lower in item.name.lower():
-                known_safe = allergy_lower not in [a.lower() for a in item.allergies]
-                return {
-                    "item": item.name,
-                    "is_safe": known_safe,
-                    "known_allergens": item.allergies,
-                    "recommendation": (
-                        "Appears safe based on known ingredients."
-                        if known_safe
-                        else f"Contains {allergy}. Not recommended for your allergy."
-                    ),
-                }
+        profile = self.db.find_allergen_profile("menu_items", item_id_lower)
+        if profile is not None:
+            item = profile.record
+            known_safe = allergy_lower not in profile.allergies
+            return {
+                "item": item.name,
+                "is_safe": known_safe,
+                "known_allergens": item.allergies,
+                "recommendation": (
+                    "Appears safe based on known ingredients."
+                    if known_safe
+                    else f"Contains {allergy}. Not recommended for your allergy."
+                ),
+            }
 
         raise ValueError(f"Item {item_id} not found")
 
@@ -618,33 +676,11 @@ class HospitalityTools(ToolKitBase):
         Returns:
             Availability status and details.
         """
-        now = get_now()
-        today = get_today()
-
-        is_holiday = is_federal_holiday(today)
-        is_wkday = is_weekday(today)
-        is_lunch = is_lunch_time(now)
-
-        available = is_wkday and is_lunch and not is_holiday
-
-        reason = None
-        if is_holiday:
-            reason = "Lunch special is not available on federal holidays."
-        elif not is_wkday:
-            reason = "Lunch special is only available Monday through Friday."
-        elif not is_lunch:
-            reason = "Lunch special is only available before 5 PM."
-
+        status = _lunch_special_status(get_today(), get_now())
         return {
-            "available": available,
-            "current_date": str(today),
-            "current_time": now.strftime("%H:%M"),
-            "is_federal_holiday": is_holiday,
-            "is_weekday": is_wkday,
-            "is_before_5pm": is_lunch,
-            "reason": reason,
+            **status,
             "price": self.db.lunch_special.price
-            if self.db.lunch_special and available
+            if self.db.lunch_special and status["available"]
             else None,
         }
 
@@ -702,23 +738,18 @@ class HospitalityTools(ToolKitBase):
         Returns:
             Inventory information including stock level.
         """
-        item_name_lower = item_name.lower().strip()
-        
-        for inv in self.db.inventory:
-            inv_name_lower = inv.name.lower()
-            # Robust matching: Exact, or substring if length is sufficient
-            if inv_name_lower == item_name_lower or \
-               (len(item_name_lower) > 3 and item_name_lower in inv_name_lower) or \
-               (inv.item_id.lower() == item_name_lower):
-                return {
-                    "item_id": inv.item_id,
-                    "name": inv.name,
-                    "stock": inv.stock,
-                    "in_stock": inv.stock > 0,
-                    "item_type": inv.item_type,
-                    "points_required": inv.points_required,
-                }
-        raise ValueError(f"Inventory item '{item_name}' not found")
+        # Robust matching: Exact name or ID, or substring if length is sufficient
+        inv = self.db.find_inventory_item(item_name.lower().strip())
+        if inv is None:
+            raise ValueError(f"Inventory item '{item_name}' not found")
+        return {
+            "item_id": inv.item_id,
+            "name": inv.name,
+            "stock": inv.stock,
+            "in_stock": inv.stock > 0,
+            "item_type": inv.item_type,
+            "points_required": inv.points_required,
+        }
 
     @is_tool(ToolType.READ)
     def get_reservation_details(
@@ -746,22 +777,21 @@ class HospitalityTools(ToolKitBase):
         
         # Search by table_id first (most common for dine-in)
         if table_id:
-            for res in self.db.reservations:
-                if res.table_id == table_id and res.status == ReservationStatus.SEATED:
+            for res in self.db.get_reservations_for_table(table_id):
+                if res.status == ReservationStatus.SEATED:
                     return res
         
         # Search by phone
         if phone:
-            for res in self.db.reservations:
-                if res.phone == phone:
-                    return res
+            res = self.db.get_reservation_by_phone(phone)
+            if res is not None:
+                return res
         
         # Search by name (partial match)
         if customer_name:
-            name_lower = customer_name.lower()
-            for res in self.db.reservations:
-                if name_lower in res.customer_name.lower():
-                    return res
+            res = self.db.find_reservation_by_name(customer_name.lower())
+            if res is not None:
+                return res
         
         raise ValueError("Reservation not found. Provide reservation_id, phone, customer_name, or table_id.")
 
@@ -779,8 +809,8 @@ class HospitalityTools(ToolKitBase):
         """
         if order_id:
             return self._get_order_by_id(order_id)
-        elif self.db.orders:
-            return self.db.orders[-1]  # Return most recent order
+        elif self.db.current_order is not None:
+            return self.db.current_order
         else:
             return {
                 "message": "No active order for current table",
@@ -842,9 +872,7 @@ class HospitalityTools(ToolKitBase):
             Created reservation details.
         """
         # Check weekend/holiday party size limit
-        check_date = datetime.strptime(date_str, "%Y-%m-%d").date()
-        is_weekend = check_date.weekday() >= 5
-        is_holiday = is_federal_holiday(check_date)
+        is_weekend, is_holiday = classify_date(date_str)
 
         if (is_weekend or is_holiday) and party_size > 20:
             raise ValueError(
@@ -874,7 +902,7 @@ class HospitalityTools(ToolKitBase):
         self.db.reservations.append(reservation)
         self.db.reservation_confirmed = True  # Track that reservation was created
 
-        logger.info(f"Created reservation {reservation_id} for {customer_name}")
+        logger.info("Created reservation {} for {}", reservation_id, customer_name)
 
         return {
             "message": "Reservation created successfully",
@@ -959,8 +987,8 @@ class HospitalityTools(ToolKitBase):
         """
         # If no order_id, use current/active order or create placeholder
         if not order_id:
-            if self.db.orders:
-                order = self.db.orders[-1]  # Use most recent order
+            order = self.db.current_order
+            if order is not None:
                 order_id = order.order_id
             else:
                 # Create a placeholder order for tracking
@@ -1004,7 +1032,11 @@ class HospitalityTools(ToolKitBase):
         order.total = order.subtotal + order.tax - discount_amount
 
         logger.info(
-            f"Applied {discount_type} discount of {discount_value} to order {order_id}. Reason: {reason}"
+            "Applied {} discount of {} to order {}. Reason: {}",
+            discount_type,
+            discount_value,
+            order_id,
+            reason,
         )
 
         return {
@@ -1045,14 +1077,14 @@ class HospitalityTools(ToolKitBase):
             incident_id=incident_id,
             order_id=order_id,
             table_id=table_id,
-            incident_type=IncidentType(incident_type),
+            incident_type=IncidentType.lookup(incident_type),
             description=description,
             created_at=get_now().isoformat(),
         )
 
         self.db.incidents.append(incident)
 
-        logger.info(f"Recorded incident {incident_id}: {incident_type}")
+        logger.info("Recorded incident {}: {}", incident_id, incident_type)
 
         return {
             "message": "Incident recorded",
@@ -1078,43 +1110,39 @@ class HospitalityTools(ToolKitBase):
             table_id = "current_table"
             
         # Check if this table already used a code
-        for order in self.db.orders:
-            if order.table_id == table_id and order.secret_code_used:
+        for order in self.db.get_orders_for_table(table_id):
+            if order.secret_code_used:
                 raise ValueError(
                     "This table has already redeemed a secret code. "
                     "Only one secret code per table is allowed."
                 )
 
-        # Normalize input phrase
-        input_normalized = code_phrase.lower().strip().rstrip(".")
-
         # Find matching code (Robust matching)
-        for sc in self.db.secret_codes:
-            code_normalized = sc.code.lower().strip().rstrip(".")
-            # Allow partial match if key phrase is contained, or exact match
-            if code_normalized in input_normalized or input_normalized in code_normalized:
-                # Check inventory if applicable
-                if sc.reward_item_id:
-                    try:
-                        inv = self._get_inventory_by_id(sc.reward_item_id)
-                        if inv.stock <= 0:
-                            return {
-                                "success": False,
-                                "message": f"Sorry, we're currently out of {sc.reward_item}. "
-                                f"Would you like an alternative gift?",
-                                "alternative": "Assorted Kids Toy"
-                                if "wand" in sc.reward_item.lower()
-                                else None,
-                            }
-                        inv.stock -= 1
-                    except ValueError:
-                        pass
+        sc = self.db.find_secret_code(normalize_code_phrase(code_phrase))
+        if sc is not None:
+            # Check inventory if applicable
+            inv = (
+                self.db.get_inventory_item(sc.reward_item_id)
+                if sc.reward_item_id
+                else None
+            )
+            if inv is not None:
+                if inv.stock <= 0:
+                    return {
+                        "success": False,
+                        "message": f"Sorry, we're currently out of {sc.reward_item}. "
+                        f"Would you like an alternative gift?",
+                        "alternative": "Assorted Kids Toy"
+                        if "wand" in sc.reward_item.lower()
+                        else None,
+                    }
+                inv.stock -= 1
 
-                return {
-                    "success": True,
-                    "message": f"Secret code accepted! Enjoy your free {sc.reward_item}!",
-                    "reward": sc.reward_item,
-                }
+            return {
+                "success": True,
+                "message": f"Secret code accepted! Enjoy your free {sc.reward_item}!",
+                "reward": sc.reward_item,
+            }
 
         return {
             "success": False,
@@ -1151,11 +1179,8 @@ class HospitalityTools(ToolKitBase):
             )
 
         # Find the item price
-        item_price = 0.0
-        for item in self.db.menu_items:
-            if item.name.lower() == item_name.lower():
-                item_price = item.price
-                break
+        item = self.db.get_menu_item_by_name(item_name)
+        item_price = item.price if item is not None else 0.0
 
         if item_price > auth.comp_item_limit:
             raise ValueError(
@@ -1177,7 +1202,7 @@ class HospitalityTools(ToolKitBase):
         order.items.append(comp_item)
 
         logger.info(
-            f"Added comp item {item_name} to order {order_id}. Reason: {reason}"
+            "Added comp item {} to order {}. Reason: {}", item_name, order_id, reason
         )
 
         return {
@@ -1223,8 +1248,8 @@ class HospitalityTools(ToolKitBase):
             reward = "$20 voucher"
         else:
             # Check merchandise
-            for inv in self.db.inventory:
-                if inv.name.lower() == redemption_type.lower() and inv.points_required:
+            for inv in self.db.get_inventory_items_by_name(redemption_type):
+                if inv.points_required:
                     points_required = inv.points_required
                     reward = inv.name
                     if inv.stock <= 0:
@@ -1275,6 +1300,7 @@ class HospitalityTools(ToolKitBase):
         "free_dessert_next_visit",  # Free dessert on next visit
         "discount_next_visit",  # Discount on next visit
     ]
+    _AVAILABLE_ACTION_SET = frozenset(AVAILABLE_ACTIONS)
 
     @is_tool(ToolType.WRITE)
     def escalate_with_solution(
@@ -1301,12 +1327,12 @@ class HospitalityTools(ToolKitBase):
         Returns:
             Confirmation of escalation with recorded recommendations.
         """
-        if escalate_to not in ["host", "manager"]:
+        if escalate_to not in {"host", "manager"}:
             raise ValueError("escalate_to must be 'host' or 'manager'")
 
         # Validate actions
         invalid_actions = [
-            a for a in recommended_actions if a not in self.AVAILABLE_ACTIONS
+            a for a in recommended_actions if a not in self._AVAILABLE_ACTION_SET
         ]
         if invalid_actions:
             raise ValueError(
@@ -1390,10 +1416,12 @@ class HospitalityTools(ToolKitBase):
         
         # Get current bill amount
         bill_amount = 0
-        if self.db.orders:
-            bill_amount = self.db.orders[-1].total or self.db.orders[-1].subtotal or 0
-        
-        if damage_severity.lower() == "minor":
+        order = self.db.current_order
+        if order is not None:
+            bill_amount = order.total or order.subtotal or 0
+
+        severity = damage_severity.lower()
+        if severity == "minor":
             compensation = "$30 dry cleaning reimbursement"
             self.db.comp_items_given.append("dry_cleaning_30")
             return {
@@ -1402,7 +1430,7 @@ class HospitalityTools(ToolKitBase):
                 "compensation": compensation,
                 "action": "Deduct $30 from bill for dry cleaning",
             }
-        elif damage_severity.lower() == "major":
+        elif severity == "major":
             self.db.comp_items_given.append("dry_cleaning_30")
             self.db.escalation_made = True
             self.db.escalation_to = "manager"
@@ -1507,11 +1535,11 @@ class HospitalityTools(ToolKitBase):
         if is_safe:
             self.db.safe_items_recommended.append(item_id)
             # Check if this is actually unsafe (has hidden ingredients)
-            for soup in self.db.soup_bases:
-                if soup.id == item_id:
-                    if soup.contains_pre_processed and soup.name != "Plain Water":
-                        # Agent confirmed unsafe item as safe - this is a critical error
-                        self.db.unsafe_recommendation_made = True
+            soup = self.db.get_soup_base(item_id)
+            if soup is not None:
+                if soup.contains_pre_processed and soup.name != "Plain Water":
+                    # Agent confirmed unsafe item as safe - this is a critical error
+                    self.db.unsafe_recommendation_made = True
 
         return {
             "recorded": True,
@@ -1549,20 +1577,19 @@ class HospitalityTools(ToolKitBase):
         if not self.db.mood_explicitly_set:
             return {"has_member": True, "note": "Default - existing member assumed"}
         
-        if self.db.orders:
-            order = self.db.orders[-1]
+        order = self.db.current_order
+        if order is not None:
             if order.has_member and order.customer_id:
                 # Try to get customer info
-                try:
-                    customer = self._get_customer_by_id(order.customer_id)
-                    return {
-                        "has_member": True,
-                        "member_name": customer.name,
-                        "member_tier": customer.tier.value,
-                        "points": customer.points
-                    }
-                except ValueError:
+                customer = self.db.get_customer(order.customer_id)
+                if customer is None:
                     return {"has_member": True, "member_name": "Member"}
+                return {
+                    "has_member": True,
+                    "member_name": customer.name,
+                    "member_tier": customer.tier.value,
+                    "points": customer.points
+                }
             return {"has_member": order.has_member}
         
         return {"has_member": False}
@@ -1610,8 +1637,6 @@ class HospitalityTools(ToolKitBase):
             status: Current kitchen operational status
         """
         # Track repeated calls to prevent infinite loops
-        if not hasattr(self.db, '_kitchen_check_count'):
-            self.db._kitchen_check_count = 0
         self.db._kitchen_check_count += 1
         
         self.db.kitchen_status_checked = True
@@ -1729,15 +1754,8 @@ class HospitalityTools(ToolKitBase):
             delivered: Whether message was communicated
         """
         # Check for forbidden phrases that expose internal issues
-        forbidden_phrases = [
-            "kitchen refused", "staff won't", "cook said no",
-            "they're not cooperating", "kitchen attitude", "chef quit",
-            "staff walked out", "they said", "kitchen staff", "cook is",
-            "they won't", "back of house", "boh", "they're being",
-            "not my fault", "their fault", "kitchen's fault"
-        ]
-        
-        exposed = any(phrase in message.lower() for phrase in forbidden_phrases)
+        message_lower = message.lower()
+        exposed = any(phrase in message_lower for phrase in FORBIDDEN_DELAY_PHRASES)
         
         if exposed:
             self.db.internal_issue_exposed = True
@@ -1793,22 +1811,17 @@ class HospitalityTools(ToolKitBase):
 
     def assert_reservation_exists(self, reservation_id: str) -> bool:
         """Assert that a reservation exists."""
-        try:
-            self._get_reservation_by_id(reservation_id)
-            return True
-        except ValueError:
-            return False
+        return self.db.get_reservation(reservation_id) is not None
 
     def assert_discount_applied(self, order_id: str, max_discount_pct: float) -> bool:
         """Assert that discount on order is within limit."""
-        try:
-            order = self._get_order_by_id(order_id)
-            if not order.discount_amount:
-                return True
-            actual_pct = (order.discount_amount / order.subtotal) * 100
-            return actual_pct <= max_discount_pct
-        except ValueError:
+        order = self.db.get_order(order_id)
+        if order is None:
             return True  # No order found, no violation
+        if not order.discount_amount:
+            return True
+        actual_pct = (order.discount_amount / order.subtotal) * 100
+        return actual_pct <= max_discount_pct
 
     def assert_allergy_warning_given(self, item_id: str) -> bool:
         """Assert that proper allergy warning was provided for an item with hidden ingredients."""
@@ -1819,32 +1832,29 @@ class HospitalityTools(ToolKitBase):
 
     def assert_secret_code_limit(self, table_id: str) -> bool:
         """Assert that table has not exceeded secret code limit."""
-        codes_used = 0
-        for order in self.db.orders:
-            if order.table_id == table_id and order.secret_code_used:
-                codes_used += 1
+        codes_used = sum(
+            1
+            for order in self.db.get_orders_for_table(table_id)
+            if order.secret_code_used
+        )
         return codes_used <= 1
 
     def assert_lunch_special_correctly_applied(self, order_id: str) -> bool:
         """Assert lunch special was correctly applied (not on holidays)."""
-        try:
-            order = self._get_order_by_id(order_id)
-            today = get_today()
-            is_holiday = is_federal_holiday(today)
-
-            # If lunch special was applied on a holiday, it's wrong
-            if order.promotion_code_used == "LUNCH_SPECIAL" and is_holiday:
-                return False
-            return True
-        except ValueError:
+        order = self.db.get_order(order_id)
+        if order is None:
             return True  # No order found, no violation
 
+        # If lunch special was applied on a holiday, it's wrong
+        if order.promotion_code_used == "LUNCH_SPECIAL" and is_federal_holiday(
+            get_today()
+        ):
+            return False
+        return True
+
     def assert_incident_recorded(self, incident_type: str) -> bool:
         """Assert that an incident of the specified type was recorded."""
-        for incident in self.db.incidents:
-            if incident.incident_type.value == incident_type:
-                return True
-        return False
+        return incident_type in self.db.get_incident_types()
 
     def assert_no_incident_recorded(self) -> bool:
         """Assert that no incident was recorded (for cases where recording would be wrong)."""
@@ -1877,19 +1887,16 @@ class HospitalityTools(ToolKitBase):
 
     def assert_party_size_within_capacity(self, table_id: str, party_size: int) -> bool:
         """Assert that the party size is within the table's appropriate capacity."""
-        try:
-            table = self._get_table_by_id(table_id)
-            # Allow up to std_expansion without issue
-            return party_size <= table.std_expansion
-        except ValueError:
+        table = self.db.get_table(table_id)
+        if table is None:
             return True
+        # Allow up to std_expansion without issue
+        return party_size <= table.std_expansion
 
     def assert_reservation_party_limit(self, max_party_size: int = 20) -> bool:
         """Assert that no reservation exceeds the weekend/holiday party limit."""
         for res in self.db.reservations:
-            check_date = datetime.strptime(res.date, "%Y-%m-%d").date()
-            is_weekend = check_date.weekday() >= 5
-            is_holiday = is_federal_holiday(check_date)
+            is_weekend, is_holiday = classify_date(res.date)
             if (is_weekend or is_holiday) and res.party_size > max_party_size:
                 return False
         return True
@@ -1967,12 +1974,7 @@ class HospitalityTools(ToolKitBase):
 
     def assert_discount_within_server_authority(self) -> bool:
         """Assert all discounts are within Server authority (12%)."""
-        for order in self.db.orders:
-            if order.discount_amount and order.subtotal > 0:
-                pct = (order.discount_amount / order.subtotal) * 100
-                if pct > 12:
-                    return False
-        return True
+        return self.assert_discount_within_authority(12)
 
     def assert_correct_case_handling(self, case_level: str) -> bool:
         """
@@ -2059,14 +2061,13 @@ class HospitalityTools(ToolKitBase):
         - If customer mood is upset/rushing: should NOT offer
         - If normal mood and no member: SHOULD offer
         """
-        has_member = False
-        if self.db.orders:
-            has_member = self.db.orders[-1].has_member
-        
-        mood = self.db.customer_mood
-        
+        order = self.db.current_order
+        has_member = order is not None and order.has_member
+
         # Should NOT offer if: has member OR upset/rushing
-        should_not_offer = has_member or mood in ["upset", "rushing"]
+        should_not_offer = (
+            has_member or self.db.customer_mood in NO_MEMBERSHIP_OFFER_MOODS
+        )
         
         if should_not_offer:
             return not self.db.membership_offered
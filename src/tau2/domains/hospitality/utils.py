@@ -1,7 +1,9 @@
 """Utility functions and constants for the hospitality domain."""
 
+import functools
 from datetime import date, datetime
 from pathlib import Path
+from typing import Tuple
 
 # Base path for hospitality domain data
 HOSPITALITY_DATA_DIR = (
@@ -29,9 +31,9 @@ def get_now() -> datetime:
     return DEFAULT_DATETIME
 
 
-def is_federal_holiday(check_date: date) -> bool:
-    """Check if a given date is a federal holiday in 2026."""
-    federal_holidays_2026 = [
+# Federal holidays in 2026, as a frozenset for constant-time membership checks
+FEDERAL_HOLIDAYS_2026 = frozenset(
+    {
         date(2026, 1, 1),  # New Year's Day (Thursday)
         date(2026, 1, 19),  # MLK Day (Monday)
         date(2026, 2, 16),  # Presidents' Day (Monday)
@@ -44,8 +46,64 @@ def is_federal_holiday(check_date: date) -> bool:
         date(2026, 11, 11),  # Veterans Day (Wednesday)
         date(2026, 11, 26),  # Thanksgiving (Thursday)
         date(2026, 12, 25),  # Christmas (Friday)
-    ]
-    return check_date in federal_holidays_2026
+    }
+)
+
+
+# Peak hours as (weekday, hour) pairs: Friday 6-9pm, Saturday 5-9pm, Sunday 5-8pm
+PEAK_HOURS = frozenset(
+    [(4, hour) for hour in range(18, 22)]
+    + [(5, hour) for hour in range(17, 22)]
+    + [(6, hour) for hour in range(17, 21)]
+)
+
+
+@functools.lru_cache(maxsize=512)
+def parse_date(date_str: str) -> date:
+    """Parse a YYYY-MM-DD string. Cached, since tools re-parse the same few dates."""
+    # Slice the canonical zero-padded form directly; strptime handles the rest
+    # (e.g. unpadded "2026-1-5") and raises on malformed input.
+    if len(date_str) == 10 and date_str[4] == date_str[7] == "-" and date_str.isascii():
+        year, month, day = date_str[:4], date_str[5:7], date_str[8:]
+        if year.isdigit() and month.isdigit() and day.isdigit():
+            return date(int(year), int(month), int(day))
+    return datetime.strptime(date_str, "%Y-%m-%d").date()
+
+
+def is_peak_hour(check_date: date, hour: int) -> bool:
+    """Check if the given date and hour fall within peak hours."""
+    return (check_date.weekday(), hour) in PEAK_HOURS
+
+
+@functools.lru_cache(maxsize=1024)
+def classify_date(date_str: str) -> Tuple[bool, bool]:
+    """Classify a YYYY-MM-DD date as (is_weekend, is_holiday). Cached per date."""
+    check_date = parse_date(date_str)
+    return check_date.weekday() >= 5, is_federal_holiday(check_date)
+
+
+@functools.lru_cache(maxsize=1024)
+def classify_time_slot(date_str: str, hour: int) -> Tuple[bool, bool, bool]:
+    """Classify a YYYY-MM-DD date and hour as (is_peak, is_weekend, is_holiday).
+
+    Cached per slot: availability checks keep asking about the same few slots.
+    """
+    check_date = parse_date(date_str)
+    return (
+        is_peak_hour(check_date, hour),
+        check_date.weekday() >= 5,
+        is_federal_holiday(check_date),
+    )
+
+
+def normalize_code_phrase(phrase: str) -> str:
+    """Normalize a secret code phrase: lowercased, trimmed, trailing dots dropped."""
+    return phrase.lower().strip().rstrip(".")
+
+
+def is_federal_holiday(check_date: date) -> bool:
+    """Check if a given date is a federal holiday in 2026."""
+    return check_date in FEDERAL_HOLIDAYS_2026
 
 
 def is_weekday(check_date: date) -> bool:
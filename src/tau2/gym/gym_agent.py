@@ -642,7 +642,8 @@ class AgentGymEnv(gym.Env):
 
         Args:
             seed: Optional random seed for reproducibility (passed to gym.Env.reset)
-            options: Optional configuration options (passed to gym.Env.reset)
+            options: Optional configuration options. A "task_id" entry switches
+                the environment to that task, so one instance can run many tasks.
 
         Returns:
             A tuple containing:
@@ -657,6 +658,9 @@ class AgentGymEnv(gym.Env):
         super().reset(seed=seed)
 
         with self._lock:
+            if options and "task_id" in options:
+                self.task_id = options["task_id"]
+
             # Reset state
             self._simulation_run = None
             self._simulation_done.clear()
@@ -1184,7 +1188,8 @@ class UserGymEnv(gym.Env):
 
         Args:
             seed: Optional random seed for reproducibility
-            options: Optional configuration options
+            options: Optional configuration options. A "task_id" entry switches
+                the environment to that task, so one instance can run many tasks.
 
         Returns:
             A tuple containing:
@@ -1194,6 +1199,9 @@ class UserGymEnv(gym.Env):
         super().reset(seed=seed)
 
         with self._lock:
+            if options and "task_id" in options:
+                self.task_id = options["task_id"]
+
             # Reset state
             self._simulation_run = None
             self._simulation_done.clear()
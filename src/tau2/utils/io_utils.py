@@ -6,6 +6,7 @@ from typing import Any
 
 import toml
 import yaml
+from pydantic_core import from_json
 
 
 def expand_paths(paths: list[str], extension: str | None = None) -> list[str]:
@@ -64,8 +65,13 @@ def load_file(path: str | Path, **kwargs: Any) -> dict[str, Any]:
     """
     path = Path(path)
     if path.suffix == ".json":
-        with open(path, "r") as fp:
-            data = json.load(fp, **kwargs)
+        if kwargs:
+            with open(path, "r") as fp:
+                data = json.load(fp, **kwargs)
+        else:
+            # Parse in pydantic-core's native JSON parser; much faster than json.load
+            # on the large task and DB files and yields the same Python objects
+            data = from_json(path.read_bytes())
     elif path.suffix == ".yaml" or path.suffix == ".yml":
         with open(path, "r") as fp:
             data = yaml.load(fp, Loader=yaml.SafeLoader, **kwargs)
@@ -4,6 +4,7 @@ import pytest
 
 from tau2.domains.hospitality.data_model import (
     HospitalityDB,
+    ReservationStatus,
     StaffRole,
     TableStatus,
 )
@@ -50,6 +51,15 @@ class TestHospitalityTools:
         assert "menu_items" in result
         assert all(item["category"] == "protein" for item in result["menu_items"])
 
+    def test_get_menu_details_returns_fresh_items(self, tools):
+        """Test that mutating a menu details result does not leak into later calls."""
+        first = tools.get_menu_details(category="protein")["menu_items"][0]
+        first["name"] = "Changed"
+        first["allergies"].append("changed")
+        second = tools.get_menu_details(category="protein")["menu_items"][0]
+        assert second["name"] != "Changed"
+        assert "changed" not in second["allergies"]
+
     def test_check_table_availability(self, tools):
         """Test checking table availability."""
         result = tools.check_table_availability(
@@ -68,6 +78,14 @@ class TestHospitalityTools:
             assert "max_squeeze" in table
             assert "fit_type" in table
 
+    def test_check_table_availability_returns_fresh_entries(self, tools):
+        """Test that mutating an availability entry does not leak into later calls."""
+        first = tools.check_table_availability(4, "2026-01-15", "18:00")
+        if first["available_tables"]:
+            first["available_tables"][0]["changed"] = True
+            second = tools.check_table_availability(4, "2026-01-15", "18:00")
+            assert "changed" not in second["available_tables"][0]
+
     def test_check_allergy_safety_plain_water(self, tools):
         """Test that Plain Water is always safe."""
         result = tools.check_allergy_safety("S08", "vinegar")
@@ -186,6 +204,58 @@ class TestHospitalityTools:
         assert "incident_id" in result
         assert result["incident_type"] == "slow_service"
 
+    def test_incident_assertion_sees_new_incidents(self, tools, db):
+        """Test that the cached incident types pick up newly recorded incidents."""
+        db.get_incident_types()
+        tools.record_service_incident(
+            incident_type="wrong_order",
+            description="Served beef instead of lamb",
+            table_id="A1",
+        )
+        assert tools.assert_incident_recorded("wrong_order")
+
+    def test_get_customer_by_phone_sees_new_customers(self, db):
+        """Test that the phone index picks up customers appended after first use."""
+        existing = db.customers[0]
+        assert db.get_customer_by_phone(existing.phone) is existing
+        new_customer = existing.model_copy(
+            update={"customer_id": "C_NEW", "phone": "555-000-1234"}
+        )
+        db.customers.append(new_customer)
+        assert db.get_customer_by_phone("555-000-1234") is new_customer
+
+    def test_id_lookups_follow_db_changes(self, tools, db):
+        """Test that indexed ID lookups see appended records and replaced lists."""
+        order = db.orders[0]
+        assert tools._get_order_by_id(order.order_id) is order
+        new_order = order.model_copy(update={"order_id": "ORD_NEW"})
+        db.orders.append(new_order)
+        assert tools._get_order_by_id("ORD_NEW") is new_order
+        db.orders = [new_order]
+        with pytest.raises(ValueError, match="not found"):
+            tools._get_order_by_id(order.order_id)
+
+    def test_table_availability_follows_reservation_status(self, tools, db):
+        """Test that a status change on an existing reservation frees its table."""
+        db.get_table("A1").status = TableStatus.AVAILABLE
+        res = db.reservations[0].model_copy(
+            update={
+                "reservation_id": "RES_NEW",
+                "date": "2026-03-03",
+                "table_id": "A1",
+                "status": ReservationStatus.CONFIRMED,
+            }
+        )
+        db.reservations.append(res)
+
+        def available_ids():
+            result = tools.check_table_availability(2, "2026-03-03", "12:00")
+            return {t["table_id"] for t in result["available_tables"]}
+
+        assert "A1" not in available_ids()
+        res.status = ReservationStatus.CANCELLED
+        assert "A1" in available_ids()
+
 
 class TestHospitalityEnvironment:
     """Test suite for HospitalityEnvironment."""
@@ -209,3 +279,11 @@ class TestHospitalityEnvironment:
         env = get_environment(solo_mode=True)
         # In solo mode, agent has access to both agent and user tools
         assert env.solo_mode is True
+
+    def test_environments_do_not_share_db(self):
+        """Test that each environment gets its own DB despite cached loading."""
+        env1 = get_environment()
+        env2 = get_environment()
+        assert env1.tools.db is not env2.tools.db
+        env1.tools.db.orders.clear()
+        assert len(env2.tools.db.orders) > 0
@@ -116,6 +116,17 @@ class TestTauGymEnv:
             assert env._orchestrator is not None
             assert env._agent is not None
 
+    @timeout(10)
+    def test_tau_gym_env_reset_with_task_id_option(self):
+        """Test that reset can switch the environment to another task."""
+        env = AgentGymEnv(domain="mock", task_id="invalid_task_id")
+
+        observation, info = env.reset(options={"task_id": "create_task_1"})
+
+        assert env.task_id == "create_task_1"
+        assert isinstance(observation, str)
+        assert info["task"].id == "create_task_1"
+
     @timeout(15)
     def test_tau_gym_env_observation_format(self):
         """Test that TauGymEnv formats observations correctly."""